@@ -0,0 +1,93 @@
+"""
+Measures how long `import parachute` takes, and checks that it does not
+import heavy optional dependencies (NumPy and typeguard are only imported
+when they are needed).
+
+Each measurement starts a fresh Python process. Reported:
+
+    import time   Extra time to start Python and import parachute, compared to
+                  starting Python only, in milliseconds (best of all runs).
+    relative      Import time, in units of the startup time of Python on the
+                  same machine. Compared against the stored baseline.
+
+Usage (from the project root):
+
+    python benchmarks/bench_import.py           Run, and compare to the stored
+                                                baseline.
+    python benchmarks/bench_import.py --save    Run, and store the results as
+                                                new baseline.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+BASELINE_PATH = Path(__file__).parent / "import_baseline.json"
+SRC_PATH = Path(__file__).parent.parent / "src"
+
+HEAVY_MODULES = ("numpy", "typeguard")
+
+CHECK_MODULES = f"""
+import sys
+import parachute
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+if loaded:
+    sys.exit("Imported by `import parachute`: " + ", ".join(loaded))
+"""
+
+
+def startup_time(code: str, runs: int) -> float:
+    """ Best time to run the given code in a fresh Python process, in ms. """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, env={"PYTHONPATH": str(SRC_PATH)}
+        )
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    options = parser.parse_args(argv)
+    try:
+        subprocess.run(
+            [sys.executable, "-c", CHECK_MODULES],
+            check=True,
+            env={"PYTHONPATH": str(SRC_PATH)},
+        )
+    except subprocess.CalledProcessError:
+        return 1
+    python_time = startup_time("pass", options.runs)
+    import_time = startup_time("import parachute", options.runs) - python_time
+    result = {
+        "import_time": round(import_time, 2),
+        "relative": round(import_time / python_time, 3),
+    }
+    line = f"import time: {import_time:.1f} ms, relative: {result['relative']:.2f}"
+    num_regressions = 0
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text())
+        change = result["relative"] / max(baseline["relative"], 0.01) - 1
+        line += f"  ({change:+.0%} vs. baseline)"
+        if change > options.tolerance:
+            line += "  REGRESSION"
+            num_regressions += 1
+    print(line)
+    if options.save:
+        BASELINE_PATH.write_text(json.dumps(result, indent=4) + "\n")
+        print(f"Saved baseline to {BASELINE_PATH}")
+        return 0
+    else:
+        return 1 if num_regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Measures the overhead of argument validation.
+
+For each benchmark case, a validated function call is timed and compared to a
+call of the same, unwrapped function. Reported per case:
+
+    overhead   Extra time per call, in nanoseconds.
+    relative   Overhead, in units of the duration of an empty Python function
+               call on the same machine. Used to compare against the stored
+               baseline, as it depends less on the machine.
+    peak       Peak memory allocated during a single call, in bytes (as
+               measured by `tracemalloc`). Reveals e.g. copies of arrays.
+
+Usage (from the project root):
+
+    python benchmarks/bench_validation.py             Run, and compare to the
+                                                      stored baseline.
+    python benchmarks/bench_validation.py --save      Run, and store the
+                                                      results as new baseline.
+    python benchmarks/bench_validation.py -k array    Only run cases whose name
+                                                      contains "array".
+"""
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from parachute import (
+    validate_inputs,
+    is_of_type,
+    either,
+    array,
+    vector,
+    shape,
+)
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+class Case(NamedTuple):
+    name: str
+    validated: Callable
+    unwrapped: Callable
+    args: tuple = ()
+    kwargs: dict = {}
+
+
+def make_case(name: str, function: Callable, *args, **kwargs) -> Case:
+    return Case(name, validate_inputs(function), function, args, kwargs)
+
+
+def make_direct_case(name: str, check: Callable, *args) -> Case:
+    """ A case that times a single call to a checking function. """
+    return Case(name, check, _noop, args)
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+# fmt: off
+def scalars(a: int, b: float, c: str = "c", d: bool = True):
+    pass
+
+def generics(
+    a: Tuple[int, ...],
+    b: List[float],
+    c: Dict[str, int],
+    d: Optional[str] = None,
+    e: Union[int, str] = 0,
+):
+    pass
+
+def literal_choice(mode: either("fast", "slow", "auto") = "auto"):
+    pass
+
+def small_array(a: vector(float, 3), b: array(float, ndim=2) = np.eye(2)):
+    pass
+
+def large_array(a: array(float, ndim=2) = np.eye(2)):
+    pass
+
+def many_args(
+    a: int, b: int, c: int, d: int, e: float,
+    f: float, g: float, h: str, i: str, j: bool = False,
+):
+    pass
+# fmt: on
+
+small = np.ones(3)
+large = np.ones((1000, 1000))
+large_int = np.ones((1000, 1000), dtype=int)
+
+cases = (
+    make_case("scalars", scalars, 1, 2.0, "c", False),
+    make_case("scalars_kwargs", scalars, a=1, b=2.0, c="c", d=False),
+    make_case("generics", generics, (1, 2, 3), [1.0, 2.0], {"a": 1}, "d", 5),
+    make_case("literal_choice", literal_choice, "slow"),
+    make_case("small_array", small_array, small),
+    make_case("small_array_list", small_array, [1, 2, 3]),
+    make_case("large_array", large_array, large),
+    make_case("large_array_int", large_array, large_int),
+    make_case("many_args", many_args, 1, 2, 3, 4, 5.0, 6.0, 7.0, "h", "i", True),
+    make_case(
+        "many_kwargs",
+        many_args,
+        **dict(a=1, b=2, c=3, d=4, e=5.0, f=6.0, g=7.0, h="h", i="i", j=True),
+    ),
+    make_direct_case("is_of_type_float", is_of_type, 3, float),
+    make_direct_case("is_of_type_tuple", is_of_type, (1, "a"), Tuple[int, str]),
+    make_direct_case("either_check", either("a", "b", bool).check, True),
+    make_direct_case("vector_check", vector(float, 3).check, small),
+    make_direct_case("shape_check", shape((5, None)).check, (5, 4)),
+)
+
+
+def time_call(function: Callable, args: tuple, kwargs: dict) -> float:
+    """ Best time per call, in nanoseconds. """
+    timer = timeit.Timer(lambda: function(*args, **kwargs))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def peak_memory(function: Callable, args: tuple, kwargs: dict) -> int:
+    """ Peak memory allocated during a single call, in bytes. """
+    function(*args, **kwargs)  # Warm up caches.
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        function(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def run(cases: Tuple[Case, ...]) -> Dict[str, dict]:
+    call_time = time_call(_noop, (), {})
+    results = {}
+    for case in cases:
+        validated_time = time_call(case.validated, case.args, case.kwargs)
+        unwrapped_time = time_call(case.unwrapped, case.args, case.kwargs)
+        overhead = validated_time - unwrapped_time
+        results[case.name] = {
+            "overhead": round(overhead, 1),
+            "relative": round(overhead / call_time, 2),
+            "peak": peak_memory(case.validated, case.args, case.kwargs),
+        }
+    return results
+
+
+def report(results: Dict[str, dict], baseline: dict, tolerance: float) -> int:
+    """ Prints the results. Returns the number of regressions. """
+    num_regressions = 0
+    header = f"{'case':<20} {'overhead (ns)':>14} {'relative':>9} {'peak (B)':>10}"
+    print(header + "  vs. baseline")
+    for name, result in results.items():
+        line = (
+            f"{name:<20} {result['overhead']:>14.0f} "
+            f"{result['relative']:>9.1f} {result['peak']:>10}"
+        )
+        previous = baseline.get(name)
+        if previous is not None:
+            change = result["relative"] / max(previous["relative"], 1) - 1
+            line += f"  {change:+.0%}"
+            memory_grew = result["peak"] > 2 * max(previous["peak"], 1024)
+            if (change > tolerance) or memory_grew:
+                line += "  REGRESSION"
+                num_regressions += 1
+        print(line)
+    return num_regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("-k", default="", help="Substring of case names to run.")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    options = parser.parse_args(argv)
+    selected_cases = tuple(case for case in cases if options.k in case.name)
+    results = run(selected_cases)
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text())
+    else:
+        baseline = {}
+    num_regressions = report(results, baseline, options.tolerance)
+    if options.save:
+        baseline.update(results)
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=4) + "\n")
+        print(f"Saved baseline to {BASELINE_PATH}")
+        return 0
+    else:
+        return 1 if num_regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,43 @@
+from parachute import util as _util, validarg as _validarg
+from parachute.validators import base as _base
 from parachute.util import *
 from parachute.validarg import *
 from parachute.validators.base import *
-from parachute.validators.ndarray import *
+
+# The ndarray validators need NumPy, which takes long to import. They are
+# imported on first access, so that code that does not use them does not pay
+# for it. (These are the names in `parachute.validators.ndarray.__all__`).
+_ndarray_names = (
+    "Arbitrary",
+    "DType",
+    "ShapeType",
+    "DimSizeSpec",
+    "ShapeSpec",
+    "dimsize",
+    "shape",
+    "compile_shape_spec",
+    "compile_dtype_spec",
+    "compile_layout_spec",
+    "compile_array_spec",
+    "compile_value_spec",
+    "array",
+    "vector",
+    "set_zero_copy_default",
+    "ValueSpec",
+    "ElementValueError",
+)
+
+
+def __getattr__(name: str):
+    if name in _ndarray_names:
+        import parachute.validators.ndarray as ndarray
+
+        return getattr(ndarray, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ndarray_names))
+
+
+__all__ = [*_util.__all__, *_validarg.__all__, *_base.__all__, *_ndarray_names]
@@ -1,10 +1,25 @@
+import reprlib
 import typing
+from functools import lru_cache
 from inspect import isclass, getsource
-from typing import Callable, Any, Type
+from itertools import chain
+from typing import Callable, Any, Type, Union, Optional, Tuple, TypeVar
 
-import typeguard
 from parachute.validators.base import ValidatedArgument
 
+__all__ = [
+    "is_literal",
+    "is_type",
+    "is_typing_type",
+    "is_of_type",
+    "get_type_checker",
+    "compile_type_checker",
+    "get_instance_types",
+    "make_docstring",
+    "pretty_str",
+    "short_str",
+]
+
 
 def is_literal(value: Any) -> bool:
     return not is_type(value)
@@ -23,31 +38,185 @@ def is_typing_type(value: Any) -> bool:
     Whether a value is one of the types from the `typing` module (such as
     `Sequence[int]`, `Union[bool, str]`, or `Any`).
     """
-    return type(value) in (
-        typing._GenericAlias,
-        typing._VariadicGenericAlias,
-        typing._SpecialForm,
-        typing.TypeVar,
+    return type(value) in _typing_type_classes
+
+
+# The classes of the objects in the `typing` module are private, and differ
+# between Python versions. Collect those that exist in the running interpreter.
+_typing_type_classes = tuple(
+    getattr(typing, name)
+    for name in (
+        "_GenericAlias",
+        "_VariadicGenericAlias",
+        "_SpecialGenericAlias",
+        "_TupleType",
+        "_CallableType",
+        "_UnionGenericAlias",
+        "_CallableGenericAlias",
+        "_LiteralGenericAlias",
+        "_AnnotatedAlias",
+        "_SpecialForm",
+        "_LiteralSpecialForm",
+        "_AnyMeta",
+        "TypeVar",
     )
+    if hasattr(typing, name)
+)
 
 
 def is_of_type(value: Any, ttype: Type) -> bool:
     """
     Returns whether a value is of a given type.
     """
-    if is_type(ttype):
-        if ttype == ValidatedArgument:
-            return isclass(value) and issubclass(value, ValidatedArgument)
-        else:
-            # Defer to the "typeguard" package:
-            try:
-                typeguard.check_type("value", value, expected_type=ttype)
-                return True
-            except TypeError:
-                return False
+    return get_type_checker(ttype)(value)
+
+
+def get_type_checker(ttype: Type) -> Callable[[Any], bool]:
+    """
+    Returns a function that checks whether a value is of the given type.
+
+    The type itself is only inspected here, once. Calling the returned checker
+    does not repeat this work. Checkers are cached per type.
+    """
+    try:
+        hash(ttype)
+    except TypeError:
+        return compile_type_checker(ttype)
     else:
+        return _get_cached_type_checker(ttype)
+
+
+def compile_type_checker(ttype: Type) -> Callable[[Any], bool]:
+    """
+    Builds a specialised checker function for the given type.
+
+    Plain classes and the common constructs from the `typing` module (`Any`,
+    `Union`, `Optional`, `Tuple`, `List`, `Dict` and `Literal`) are checked
+    natively. More exotic types are deferred to the "typeguard" package.
+    """
+    if not is_type(ttype):
         msg = f"Argument `ttype` must be a type, but got {pretty_str(ttype)}."
         raise TypeError(msg)
+    if ttype == ValidatedArgument:
+        return _is_validated_argument_class
+    if ttype is Any:
+        return _accept_any
+    instance_types = get_instance_types(ttype)
+    if instance_types is not None:
+        return lambda value: isinstance(value, instance_types)
+    origin = getattr(ttype, "__origin__", None)
+    args = getattr(ttype, "__args__", None)
+    if origin is Union:
+        return _compile_union_checker(args)
+    elif (args is None) or any(isinstance(arg, TypeVar) for arg in args):
+        # Unparametrised generic, such as `List` or `Tuple[T, T]`.
+        pass
+    elif origin is tuple:
+        return _compile_tuple_checker(args)
+    elif origin is list:
+        check_item = get_type_checker(args[0])
+        return lambda value: isinstance(value, list) and all(
+            check_item(item) for item in value
+        )
+    elif origin is dict:
+        check_key = get_type_checker(args[0])
+        check_value = get_type_checker(args[1])
+        return lambda value: isinstance(value, dict) and all(
+            check_key(k) and check_value(v) for k, v in value.items()
+        )
+    elif (origin is not None) and (origin is getattr(typing, "Literal", None)):
+        return lambda value: value in args
+    return _get_typeguard_checker(ttype)
+
+
+_get_cached_type_checker = lru_cache(maxsize=1024)(compile_type_checker)
+
+
+# Types for which typeguard accepts values of other types as well
+# (following PEP 484's numeric tower, and
+# https://github.com/python/typing/issues/552 for `bytes`).
+_widened_types = {
+    float: (float, int),
+    complex: (complex, float, int),
+    bytes: (bytes, bytearray, memoryview),
+}
+
+
+def get_instance_types(ttype: Type) -> Optional[Tuple[type, ...]]:
+    """
+    The classes to pass to `isinstance`, when checking for the given type
+    comes down to a single `isinstance` call (e.g. `(float, int)` for `float`).
+    Else, None.
+    """
+    if isclass(ttype) and (ttype in _widened_types):
+        return _widened_types[ttype]
+    elif (
+        isclass(ttype)
+        and not is_typing_type(ttype)
+        # These classes get special treatment in typeguard:
+        and ((ttype in (tuple, dict)) or not issubclass(ttype, _special_classes))
+        and not getattr(ttype, "_is_protocol", False)
+    ):
+        return (ttype,)
+    else:
+        return None
+
+
+_special_classes = (tuple, dict, float, complex, bytes, typing.IO)
+
+
+def _compile_union_checker(args: Tuple[Type, ...]) -> Callable[[Any], bool]:
+    instance_types = [get_instance_types(arg) for arg in args]
+    if None not in instance_types:
+        # Check all options with a single `isinstance` call.
+        merged_types = tuple(chain.from_iterable(instance_types))
+        return lambda value: isinstance(value, merged_types)
+    else:
+        checks = tuple(get_type_checker(arg) for arg in args)
+        return lambda value: any(check(value) for check in checks)
+
+
+def _compile_tuple_checker(args: Tuple[Type, ...]) -> Callable[[Any], bool]:
+    if args in ((), ((),)):
+        # `Tuple[()]`, the empty tuple.
+        return lambda value: isinstance(value, tuple) and len(value) == 0
+    elif (len(args) == 2) and (args[1] is Ellipsis):
+        # `Tuple[T, ...]`, a tuple of arbitrary length.
+        check_item = get_type_checker(args[0])
+        return lambda value: isinstance(value, tuple) and all(
+            check_item(item) for item in value
+        )
+    else:
+        checks = tuple(get_type_checker(arg) for arg in args)
+        num_items = len(checks)
+        return lambda value: (
+            isinstance(value, tuple)
+            and len(value) == num_items
+            and all(check(item) for check, item in zip(checks, value))
+        )
+
+
+def _get_typeguard_checker(ttype: Type) -> Callable[[Any], bool]:
+    # Defer to the "typeguard" package (imported only now, as most types are
+    # checked natively, and importing it takes a while):
+    import typeguard
+
+    def check(value: Any) -> bool:
+        try:
+            typeguard.check_type("value", value, expected_type=ttype)
+            return True
+        except TypeError:
+            return False
+
+    return check
+
+
+def _accept_any(value: Any) -> bool:
+    return True
+
+
+def _is_validated_argument_class(value: Any) -> bool:
+    return isclass(value) and issubclass(value, ValidatedArgument)
 
 
 def make_docstring(function: Callable):
@@ -112,3 +281,35 @@ def pretty_str(x: Any) -> str:
     else:
         text = repr(x)
     return text
+
+
+def short_str(x: Any) -> str:
+    """
+    Like `pretty_str`, but summarises large values: big arrays are described
+    by their type, shape and dtype, and long strings and containers are
+    truncated.
+    """
+    size = getattr(x, "size", None)
+    if is_type(x):
+        return pretty_str(x)
+    elif (
+        isinstance(size, int)
+        and (size > _max_array_size)
+        and hasattr(x, "shape")
+        and hasattr(x, "dtype")
+    ):
+        # A (NumPy) array.
+        return f"{type(x).__name__} of shape {x.shape} and dtype {x.dtype}"
+    else:
+        return _short_repr.repr(x)
+
+
+_max_array_size = 24
+# Arrays with more elements than this are summarised by `short_str`.
+
+_short_repr = reprlib.Repr()
+_short_repr.maxstring = 80
+_short_repr.maxother = 80
+_short_repr.maxlevel = 3
+_short_repr.maxlist = _short_repr.maxtuple = 12
+_short_repr.maxset = _short_repr.maxfrozenset = _short_repr.maxdict = 12
@@ -1,49 +1,1191 @@
 import inspect
+import json
+import os
 import textwrap
-from functools import wraps
-from typing import Callable, Any
+from collections import deque
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Generator,
+    AsyncIterable,
+    AsyncIterator,
+    AsyncGenerator,
+)
+from contextlib import contextmanager
+from dataclasses import fields
+from enum import Enum
+from functools import wraps, partial, lru_cache
+from itertools import count
+from threading import Lock
+from time import perf_counter_ns
+from weakref import WeakSet
+from typing import (
+    Callable,
+    Any,
+    Optional,
+    Tuple,
+    Dict,
+    NamedTuple,
+    TypeVar,
+    List,
+    TextIO,
+    Awaitable,
+)
 
-from parachute.util import is_of_type, pretty_str
-from parachute.validators.base import ValidatedArgument
+from parachute.util import is_of_type, get_type_checker, pretty_str, short_str
+from parachute.validators.base import (
+    ValidatedArgument,
+    CastingError,
+    SpecificationError,
+)
+
+__all__ = [
+    "Checker",
+    "Coercer",
+    "is_valid",
+    "get_checker",
+    "get_coercer",
+    "get_cached_checker",
+    "get_cached_coercer",
+    "ParameterCheck",
+    "CheckPlan",
+    "compile_check_plan",
+    "compile_return_check",
+    "compile_yield_check",
+    "set_validation",
+    "validation_mode",
+    "set_instrumentation",
+    "set_lazy_compilation",
+    "validate_inputs",
+    "preflight",
+    "get_check_cache_info",
+    "ParameterStats",
+    "FunctionStats",
+    "get_validation_stats",
+    "dump_validation_stats",
+    "reset_validation_stats",
+    "collect_argument_errors",
+    "check_arg",
+    "ArgumentError",
+    "ReturnValueError",
+    "ArgumentErrors",
+]
+
+
+Checker = Callable[[Any], bool]
+# A function that returns whether a value matches a given annotation.
+
+Coercer = Callable[[Any], Any]
+# A function that returns the canonical value of a given argument, and raises a
+# CastingError or SpecificationError when the argument does not match a given
+# annotation.
 
 
 def is_valid(value, Annotation) -> bool:
     """
     Checks whether a value matches a type hint / annotation.
     """
+    check = get_checker(Annotation)
+    return (check is None) or check(value)
+
+
+def get_checker(Annotation) -> Optional[Checker]:
+    """
+    Compiles a type hint / annotation into a function that checks whether a
+    value matches it. Returns None when there is nothing to check.
+    """
     if Annotation is None:
-        return True
+        return None
     elif is_of_type(Annotation, ValidatedArgument):
-        validated_argument = Annotation(value)
-        return validated_argument.is_valid()
+        return Annotation.check
+    else:
+        return get_type_checker(Annotation)
+
+
+def get_coercer(Annotation) -> Optional[Coercer]:
+    """
+    Compiles a type hint / annotation into a function that returns the
+    canonical value of valid arguments. For ValidatedArgument annotations,
+    this is the cast argument. Other arguments are returned as is. Returns None
+    when there is nothing to check.
+    """
+    if Annotation is None:
+        return None
+    elif is_of_type(Annotation, ValidatedArgument):
+        return Annotation.coerce
+    else:
+        return partial(_return_if_valid, check=get_type_checker(Annotation))
+
+
+def _return_if_valid(value: Any, check: Checker) -> Any:
+    if check(value):
+        return value
+    else:
+        raise SpecificationError
+
+
+def get_cached_checker(check: Checker, maxsize: int) -> Checker:
+    """
+    Wraps a checker with a bounded LRU cache of its results, for immutable
+    arguments (strings, numbers, enum members, and tuples and frozen
+    dataclasses thereof). Other arguments are checked as usual.
+
+    As with `functools.lru_cache`, the returned function has `cache_info` and
+    `cache_clear` attributes.
+    """
+
+    @lru_cache(maxsize)
+    def check_immutable(key: tuple, value: Any) -> bool:
+        return check(value)
+
+    def cached_check(value: Any) -> bool:
+        key = _get_cache_key(value)
+        if key is None:
+            return check(value)
+        else:
+            return check_immutable(key, value)
+
+    cached_check.cache_info = check_immutable.cache_info
+    cached_check.cache_clear = check_immutable.cache_clear
+    return cached_check
+
+
+def get_cached_coercer(coerce: Coercer, maxsize: int) -> Coercer:
+    """
+    Wraps a coercer with a bounded LRU cache of the canonical values of
+    immutable arguments (see `get_cached_checker`). Canonical values that are
+    not immutable themselves (such as NumPy arrays) are not handed out twice:
+    they are created anew for every call. Invalid arguments are not cached.
+    """
+
+    @lru_cache(maxsize)
+    def coerce_immutable(key: tuple, value: Any) -> Optional[tuple]:
+        coerced_value = coerce(value)
+        if (coerced_value is value) or (_get_cache_key(coerced_value) is not None):
+            return (coerced_value,)
+        else:
+            return None
+
+    def cached_coerce(value: Any) -> Any:
+        key = _get_cache_key(value)
+        if key is None:
+            return coerce(value)
+        cached = coerce_immutable(key, value)
+        if cached is None:
+            return coerce(value)
+        else:
+            return cached[0]
+
+    cached_coerce.cache_info = coerce_immutable.cache_info
+    cached_coerce.cache_clear = coerce_immutable.cache_clear
+    return cached_coerce
+
+
+_immutable_types = frozenset((str, bytes, int, float, complex, bool, type(None)))
+
+
+def _get_cache_key(value: Any) -> Optional[tuple]:
+    """
+    A hashable key that identifies an immutable value, including the types of
+    its elements (so that e.g. `(1,)` and `(True,)` get different keys). None
+    if the value is not (known to be) immutable.
+    """
+    value_type = type(value)
+    if (value_type in _immutable_types) or isinstance(value, Enum):
+        return (value_type, value)
+    elif value_type in (tuple, frozenset):
+        items = value
+    elif getattr(getattr(value_type, "__dataclass_params__", None), "frozen", False):
+        items = tuple(getattr(value, field.name) for field in fields(value))
+    else:
+        return None
+    item_keys = tuple(_get_cache_key(item) for item in items)
+    if None in item_keys:
+        return None
+    else:
+        return (value_type, item_keys)
+
+
+class ParameterCheck(NamedTuple):
+    index: Optional[int]
+    #     Position of the parameter in the function signature. For a `*args`
+    #     parameter, the position of the first extra positional argument. None
+    #     for keyword-only and `**kwargs` parameters.
+    name: str
+    check: Checker
+    coerce: Coercer
+
+
+class CheckPlan(NamedTuple):
+    """
+    The argument checks of a function, compiled once at decoration time.
+    """
+
+    positional: Tuple[ParameterCheck, ...]
+    #     Checks of the annotated positional parameters, in signature order.
+    by_name: Dict[str, ParameterCheck]
+    #     Checks of all annotated named parameters (positional and keyword-only),
+    #     looked up by parameter name.
+    keyword: Dict[str, Optional[ParameterCheck]]
+    #     Checks for keyword arguments: all named parameters that can be passed
+    #     by keyword, including those without annotation (None). Keywords that
+    #     are not in here (including the names of positional-only parameters)
+    #     go to the `**kwargs` parameter, if any.
+    varargs: Optional[ParameterCheck]
+    #     Check of every extra positional argument (annotated `*args`).
+    varkw: Optional[ParameterCheck]
+    #     Check of every extra keyword argument (annotated `**kwargs`).
+    defaults: Tuple[Tuple[str, Any], ...]
+    #     Names and default values of the parameters that have one.
+    num_positional_only: int = 0
+    #     Number of leading positional parameters that can not be passed by
+    #     keyword.
+
+
+def _get_argspec(function: Callable) -> inspect.FullArgSpec:
+    """
+    The same as `inspect.getfullargspec(function)`, but read directly from the
+    function's code object, when it has one (which is a lot faster).
+    """
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return inspect.getfullargspec(function)
+    num_args = code.co_argcount
+    num_kwonlyargs = code.co_kwonlyargcount
+    names = code.co_varnames
+    args = list(names[:num_args])
+    kwonlyargs = list(names[num_args : num_args + num_kwonlyargs])
+    # The names of the `*args` and `**kwargs` parameters, if any, come next.
+    index = num_args + num_kwonlyargs
+    if code.co_flags & inspect.CO_VARARGS:
+        varargs = names[index]
+        index += 1
+    else:
+        varargs = None
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        varkw = names[index]
     else:
-        return is_of_type(value, Annotation)
+        varkw = None
+    return inspect.FullArgSpec(
+        args=args,
+        varargs=varargs,
+        varkw=varkw,
+        defaults=function.__defaults__,
+        kwonlyargs=kwonlyargs,
+        kwonlydefaults=function.__kwdefaults__,
+        annotations=function.__annotations__,
+    )
 
 
-def validate_inputs(function: Callable) -> Callable:
+def compile_check_plan(
+    function: Callable,
+    cache_size: int = 0,
+    stats: Optional["FunctionStats"] = None,
+    coerce: bool = False,
+) -> CheckPlan:
+    """
+    Resolves the annotations of a function's parameters into bound checkers.
+    When `cache_size` is not zero, the checkers (or, when `coerce` is True, the
+    coercers) cache their results for that many immutable arguments (see
+    `get_cached_checker` and `get_cached_coercer`). When `stats` are given, the
+    checkers record how long they take.
+    """
+    spec = _get_argspec(function)
+
+    def get_parameter_check(index: Optional[int], arg_name: Optional[str]):
+        if arg_name is None:
+            # No `*args` or `**kwargs` parameter.
+            return None
+        Annotation = function.__annotations__.get(arg_name)
+        check = get_checker(Annotation)
+        if check is None:
+            return None
+        coerce_arg = get_coercer(Annotation)
+        if cache_size and coerce:
+            coerce_arg = get_cached_coercer(coerce_arg, cache_size)
+        elif cache_size:
+            check = get_cached_checker(check, cache_size)
+        if stats is not None:
+            param_stats = stats.get_parameter_stats(arg_name)
+            check = _get_timed_checker(check, param_stats)
+            coerce_arg = _get_timed_coercer(coerce_arg, param_stats)
+        return ParameterCheck(index, arg_name, check, coerce_arg)
+
+    positional = tuple(
+        get_parameter_check(index, arg_name) for index, arg_name in enumerate(spec.args)
+    )
+    keyword_only = tuple(
+        get_parameter_check(None, arg_name) for arg_name in spec.kwonlyargs
+    )
+    named_parameters = dict(zip(spec.args + spec.kwonlyargs, positional + keyword_only))
+    by_name = {
+        name: check for name, check in named_parameters.items() if check is not None
+    }
+    # Positional-only parameters cannot be passed by keyword.
+    code = getattr(function, "__code__", None)
+    num_positional_only = getattr(code, "co_posonlyargcount", 0)
+    keyword = {
+        name: check
+        for name, check in named_parameters.items()
+        if name not in spec.args[:num_positional_only]
+    }
+    default_values = spec.defaults or ()
+    # Only the last few positional parameters have default values.
+    params_with_default = spec.args[len(spec.args) - len(default_values) :]
+    defaults = tuple(zip(params_with_default, default_values))
+    defaults += tuple((spec.kwonlydefaults or {}).items())
+    return CheckPlan(
+        positional=tuple(check for check in positional if check is not None),
+        by_name=by_name,
+        keyword=keyword,
+        varargs=get_parameter_check(len(spec.args), spec.varargs),
+        varkw=get_parameter_check(None, spec.varkw),
+        defaults=defaults,
+        num_positional_only=num_positional_only,
+    )
+
+
+_no_annotation = object()
+
+
+def compile_return_check(function: Callable) -> Optional[Callable[[Any], Any]]:
+    """
+    Compiles the return annotation of a function into a function that checks a
+    returned value, and passes it on. Raises a ReturnValueError when the value
+    is not valid. Returns None when there is nothing to check.
+
+    For `Iterator[T]` and `Generator[T, ...]` annotations, the returned iterator
+    is wrapped, so that its items are checked one by one as they are produced.
+    """
+    Annotation = function.__annotations__.get("return", _no_annotation)
+    if Annotation is _no_annotation:
+        return None
+    elif Annotation is None:
+        # `-> None` means that nothing (i.e. None) is returned (cf.
+        # `typing.get_type_hints`).
+        Annotation = type(None)
+    origin = getattr(Annotation, "__origin__", None)
+    args = getattr(Annotation, "__args__", None)
+    if (
+        (origin in (Iterable, Iterator, Generator))
+        and args
+        and not isinstance(args[0], TypeVar)
+    ):
+        check_item = get_checker(args[0])
+        if check_item is None:
+            check_item = _accept_any
+        return partial(
+            _check_items, check_item=check_item, origin=origin, function=function
+        )
+    check = get_checker(Annotation)
+    if check is None:
+        return None
+    else:
+        return partial(_check_returned_value, check=check, function=function)
+
+
+def compile_yield_check(function: Callable) -> Optional[Checker]:
+    """
+    Compiles the return annotation of an async generator function, such as
+    `AsyncIterator[T]` or `AsyncGenerator[T, S]`, into a checker of the items
+    it yields. Returns None when there is nothing to check.
+    """
+    Annotation = function.__annotations__.get("return")
+    origin = getattr(Annotation, "__origin__", None)
+    args = getattr(Annotation, "__args__", None)
+    if (
+        (origin in (AsyncIterable, AsyncIterator, AsyncGenerator))
+        and args
+        and not isinstance(args[0], TypeVar)
+    ):
+        return get_checker(args[0])
+    else:
+        return None
+
+
+def _check_returned_value(value: Any, check: Checker, function: Callable) -> Any:
+    if check(value):
+        return value
+    else:
+        raise ReturnValueError(function, value)
+
+
+def _check_items(
+    value: Any, check_item: Checker, origin: type, function: Callable
+) -> Any:
+    if inspect.isgenerator(value):
+        return _check_yielded_items(value, check_item, function)
+    elif isinstance(value, Iterator) and (origin is not Generator):
+        return (_check_item(item, check_item, function) for item in value)
+    elif isinstance(value, Iterable) and (origin is Iterable):
+        # A container, such as a list. Its items can be checked right away,
+        # without making a copy.
+        for item in value:
+            _check_item(item, check_item, function)
+        return value
+    else:
+        raise ReturnValueError(function, value)
+
+
+def _check_item(item: Any, check_item: Checker, function: Callable) -> Any:
+    if check_item(item):
+        return item
+    else:
+        raise ReturnValueError(function, item)
+
+
+def _check_yielded_items(generator, check_item: Checker, function: Callable):
+    """
+    Wraps a generator, checking the items it yields. Values sent to, and
+    exceptions thrown into the wrapping generator are passed on to the wrapped
+    one (as with `yield from`).
+    """
+    sent_value = None
+    thrown_error = None
+    while True:
+        try:
+            if thrown_error is None:
+                item = generator.send(sent_value)
+            else:
+                item = generator.throw(thrown_error)
+        except StopIteration as stop:
+            return stop.value
+        _check_item(item, check_item, function)
+        try:
+            sent_value = yield item
+            thrown_error = None
+        except GeneratorExit:
+            generator.close()
+            raise
+        except BaseException as error:
+            thrown_error = error
+
+
+def _accept_any(value: Any) -> bool:
+    return True
+
+
+_check_every = 1
+# Validated functions check every `_check_every`-th call. 0 means never.
+
+_strip = False
+# Whether `validate_inputs` returns functions undecorated.
+
+
+def set_validation(
+    enabled: bool = True,
+    #     When False, the only overhead of calling a validated function is a
+    #     single flag test.
+    every: int = 1,
+    #     Sampled validation: check only every N-th call to each validated
+    #     function (starting with the first).
+    strip: bool = False,
+    #     When True (and `enabled` is False), functions decorated from now on
+    #     are returned as they are by `validate_inputs`. This cannot be undone
+    #     for these functions.
+):
+    """
+    Switches argument validation on or off, for all validated functions.
+
+    Can also be set with the "PARACHUTE_VALIDATION" environment variable:
+    "on" (the default), "off", "strip", or a number N (same as `every=N`).
+
+    Functions decorated with `validate_inputs(coerce=True)` rely on their
+    arguments being cast, and are not affected by this setting.
+    """
+    global _check_every, _strip
+    if every < 1:
+        raise ValueError(f"`every` must be at least 1, but got {every}.")
+    _check_every = every if enabled else 0
+    _strip = strip and not enabled
+
+
+@contextmanager
+def validation_mode(enabled: bool = True, every: int = 1, strip: bool = False):
+    """
+    Context manager that applies `set_validation` within its body, and restores
+    the previous setting afterwards. Note that the setting is process-wide,
+    i.e. it also applies to other threads.
+    """
+    global _check_every, _strip
+    previous_setting = (_check_every, _strip)
+    set_validation(enabled, every, strip)
+    try:
+        yield
+    finally:
+        _check_every, _strip = previous_setting
+
+
+def _apply_environment_setting(value: str) -> None:
+    value = value.strip().lower()
+    if value in ("", "on", "true"):
+        set_validation(enabled=True)
+    elif value in ("off", "false"):
+        set_validation(enabled=False)
+    elif value == "strip":
+        set_validation(enabled=False, strip=True)
+    elif value.isdigit():
+        every = int(value)
+        set_validation(enabled=(every > 0), every=max(every, 1))
+    else:
+        msg = (
+            f"Invalid value for environment variable PARACHUTE_VALIDATION: "
+            f"{value!r}. Must be 'on', 'off', 'strip', or a number."
+        )
+        raise ValueError(msg)
+
+
+_apply_environment_setting(os.environ.get("PARACHUTE_VALIDATION", ""))
+
+
+_instrument = os.environ.get("PARACHUTE_INSTRUMENT", "").lower() in ("1", "on", "true")
+# Whether `validate_inputs` instruments the functions it decorates.
+
+
+def set_instrumentation(enabled: bool = True) -> None:
+    """
+    Sets whether functions decorated from now on record validation statistics:
+    call and failure counts, and the time spent validating each parameter
+    (see `get_validation_stats`). Functions that are not instrumented incur no
+    overhead.
+
+    Can also be enabled by setting the "PARACHUTE_INSTRUMENT" environment
+    variable to "on".
+    """
+    global _instrument
+    _instrument = enabled
+
+
+_lazy = os.environ.get("PARACHUTE_LAZY", "").lower() in ("1", "on", "true")
+# Whether `validate_inputs` defers compilation to the first call.
+
+
+def set_lazy_compilation(enabled: bool = True) -> None:
+    """
+    Sets whether functions decorated from now on are compiled (i.e. their
+    annotations analysed, and their default values validated) on their first
+    call, instead of when they are decorated. This makes importing modules
+    with many validated functions faster. See also `preflight`.
+
+    Can also be enabled by setting the "PARACHUTE_LAZY" environment variable
+    to "on".
+    """
+    global _lazy
+    _lazy = enabled
+
+
+def validate_inputs(
+    function: Optional[Callable] = None,
+    *,
+    coerce: bool = False,
+    #     If True, arguments for parameters annotated with a ValidatedArgument
+    #     (e.g. `array(...)`) are passed to the function as their cast value
+    #     (e.g. an `np.ndarray` instead of a list). Arguments are then cast
+    #     only once per call.
+    check_return: bool = False,
+    #     If True, the returned value is validated too, according to the
+    #     return annotation. Iterators and generators are validated lazily,
+    #     item by item (see `compile_return_check`). For coroutine functions,
+    #     the awaited value is validated, and for async generators, the items
+    #     they yield (see `compile_yield_check`).
+    collect_errors: bool = False,
+    #     If True, when an argument is invalid, all arguments are checked, and a
+    #     single `ArgumentErrors` is raised, listing every invalid argument.
+    cache_size: int = 0,
+    #     If not zero, the check of each parameter remembers its result for
+    #     this many immutable arguments (such as strings, numbers and tuples).
+    #     With `coerce`, it is the canonical values that are remembered. See
+    #     `get_check_cache_info`.
+    instrument: Optional[bool] = None,
+    #     Whether to record validation statistics for this function. If None,
+    #     the global setting is used (see `set_instrumentation`).
+    lazy: Optional[bool] = None,
+    #     Whether to compile the validation on the first call, instead of now.
+    #     If None, the global setting is used (see `set_lazy_compilation`).
+) -> Callable:
     """
     Decorator that validates function call arguments (and default argument
     values) according to argument annotations / type hints.
+
+    Can be used both as `@validate_inputs` and as `@validate_inputs(...)`.
+
+    Coroutine functions and async generator functions stay so. The arguments of
+    coroutine functions are checked when they are called (on Python 3.12+), or
+    else when the returned coroutine is first awaited. Those of async generator
+    functions are checked when the returned async generator is first iterated.
+    In all cases, that is before the original coroutine (or async generator) is
+    created.
+
+    In lazy mode, async generator functions are still compiled right away.
+    """
+    if function is None:
+        return partial(
+            validate_inputs,
+            coerce=coerce,
+            check_return=check_return,
+            collect_errors=collect_errors,
+            cache_size=cache_size,
+            instrument=instrument,
+            lazy=lazy,
+        )
+    if _strip and not coerce:
+        return function
+    if instrument is None:
+        instrument = _instrument
+    if lazy is None:
+        lazy = _lazy
+    compile_validated_function = partial(
+        _compile_validated_function,
+        function,
+        coerce=coerce,
+        check_return=check_return,
+        collect_errors=collect_errors,
+        cache_size=cache_size,
+        instrument=instrument,
+    )
+    if lazy and not inspect.isasyncgenfunction(function):
+        return _make_lazy_function(function, compile_validated_function)
+    else:
+        return compile_validated_function()
+
+
+def _compile_validated_function(
+    function: Callable,
+    coerce: bool,
+    check_return: bool,
+    collect_errors: bool,
+    cache_size: int,
+    instrument: bool,
+) -> Callable:
+    """
+    Analyses the annotations of a function, checks its default values, and
+    returns the validating wrapper for it (see `validate_inputs`).
     """
-    spec = inspect.getfullargspec(function)
-    # (According to the Python FAQ, the proper name for "argument name" is
-    # "parameter").
-    arg_names = spec.args
-    default_values = spec.defaults
-    # Iterate over parameters in reverse: only the last few parameters have
-    # default values.
-    for arg_name, value in zip(reversed(arg_names), reversed(default_values)):
-        check_arg(function, arg_name, value)
+    if instrument:
+        stats = _get_function_stats(function)
+    else:
+        stats = None
+    plan = compile_check_plan(function, cache_size, stats, coerce)
+    positional_checks = plan.positional
+    keyword_checks = plan.keyword
+    varargs_check = plan.varargs
+    varkw_check = plan.varkw
+    if varargs_check is not None:
+        num_positional = varargs_check.index
+    coerced_defaults = []
+    positional_only_defaults = []
+    #     Default values of the positional-only parameters that have one, in
+    #     signature order. (These can not be passed by keyword).
+    is_positional_only_default_coerced = False
+    for arg_name, value in plan.defaults:
+        # (Positional-only parameters are not in the keyword lookup).
+        is_positional_only = arg_name not in plan.keyword
+        param_check = plan.by_name.get(arg_name)
+        if param_check is not None:
+            # (These checks are not calls: they are not recorded in the
+            # function's validation statistics).
+            if not _get_untimed(param_check.check)(value):
+                raise ArgumentError(function, arg_name, value)
+            if coerce:
+                coerced_value = _get_untimed(param_check.coerce)(value)
+                if coerced_value is not value:
+                    if is_positional_only:
+                        is_positional_only_default_coerced = True
+                    else:
+                        coerced_defaults.append(
+                            (param_check.index, arg_name, coerced_value)
+                        )
+                    value = coerced_value
+        if is_positional_only:
+            positional_only_defaults.append(value)
+    if not is_positional_only_default_coerced:
+        positional_only_defaults = []
+    num_positional_only = plan.num_positional_only
+    first_positional_only_default = num_positional_only - len(positional_only_defaults)
+    is_coroutine_function = inspect.iscoroutinefunction(function)
+    is_async_generator_function = inspect.isasyncgenfunction(function)
+    if check_return and not (is_coroutine_function or is_async_generator_function):
+        returned_value_check = compile_return_check(function)
+    else:
+        # (Async values are checked by the outer wrappers, below).
+        returned_value_check = None
+
+    def make_error(arg_name, value, args, kwargs, reason=None) -> ArgumentError:
+        # Only called when an argument is invalid: the checks on the happy path
+        # are the same for both error modes.
+        if collect_errors:
+            errors = collect_argument_errors(function, plan, args, kwargs)
+            if errors:
+                return ArgumentErrors(function, errors)
+        return ArgumentError(function, arg_name, value, reason)
+
+    call_count = count()
 
     @wraps(function)
     def checked_function(*args, **kwargs):
-        for arg_name, value in zip(arg_names, args):
-            check_arg(function, arg_name, value)
+        if _check_every != 1:
+            if (_check_every == 0) or (next(call_count) % _check_every):
+                return function(*args, **kwargs)
+        num_args = len(args)
+        for index, arg_name, check, _ in positional_checks:
+            if index >= num_args:
+                break
+            if not check(args[index]):
+                raise make_error(arg_name, args[index], args, kwargs)
+        if (varargs_check is not None) and (num_args > num_positional):
+            _, arg_name, check, _ = varargs_check
+            for index in range(num_positional, num_args):
+                if not check(args[index]):
+                    raise make_error(arg_name, args[index], args, kwargs)
         for arg_name, value in kwargs.items():
-            check_arg(function, arg_name, value)
-        return function(*args, **kwargs)
+            param_check = keyword_checks.get(arg_name, varkw_check)
+            if (param_check is not None) and not param_check.check(value):
+                raise make_error(param_check.name, value, args, kwargs)
+        if returned_value_check is None:
+            return function(*args, **kwargs)
+        else:
+            return returned_value_check(function(*args, **kwargs))
+
+    @wraps(function)
+    def coercing_function(*args, **kwargs):
+        args = list(args)
+        num_args = len(args)
+        try:
+            for index, arg_name, _, coerce_arg in positional_checks:
+                if index >= num_args:
+                    break
+                value = args[index]
+                args[index] = coerce_arg(value)
+            if (varargs_check is not None) and (num_args > num_positional):
+                _, arg_name, _, coerce_arg = varargs_check
+                for index in range(num_positional, num_args):
+                    value = args[index]
+                    args[index] = coerce_arg(value)
+            for keyword, value in kwargs.items():
+                param_check = keyword_checks.get(keyword, varkw_check)
+                if param_check is not None:
+                    arg_name = param_check.name
+                    kwargs[keyword] = param_check.coerce(value)
+        except (CastingError, SpecificationError) as error:
+            raise make_error(arg_name, value, args, kwargs, error) from error
+        # Pass default values in their canonical form too (they were cast once,
+        # above).
+        for index, arg_name, coerced_value in coerced_defaults:
+            if ((index is None) or (index >= num_args)) and (arg_name not in kwargs):
+                kwargs[arg_name] = coerced_value
+        if positional_only_defaults and (
+            first_positional_only_default <= num_args < num_positional_only
+        ):
+            args += positional_only_defaults[num_args - first_positional_only_default :]
+        if returned_value_check is None:
+            return function(*args, **kwargs)
+        else:
+            return returned_value_check(function(*args, **kwargs))
+
+    if coerce:
+        validated_function = coercing_function
+    else:
+        validated_function = checked_function
+    if stats is not None:
+        validated_function = _count_calls(validated_function, function, stats)
+    if is_coroutine_function:
+        validated_function = _make_coroutine_function(
+            validated_function,
+            function,
+            compile_return_check(function) if check_return else None,
+        )
+    elif is_async_generator_function:
+        validated_function = _make_async_generator_function(
+            validated_function,
+            function,
+            compile_yield_check(function) if check_return else None,
+        )
+    validated_function.check_plan = plan
+    return validated_function
+
+
+_pending_functions = WeakSet()
+# Lazily validated functions that have not been compiled yet.
+
+_pending_functions_lock = Lock()
+
+
+def _make_lazy_function(
+    function: Callable, compile_validated_function: Callable[[], Callable]
+) -> Callable:
+    lock = Lock()
+    validated_function = None
+
+    def compile_validation() -> Callable:
+        nonlocal validated_function
+        if validated_function is None:
+            with lock:
+                # (Another thread might have compiled it in the meantime).
+                if validated_function is None:
+                    compiled_function = compile_validated_function()
+                    lazy_function.check_plan = compiled_function.check_plan
+                    validated_function = compiled_function
+                    with _pending_functions_lock:
+                        _pending_functions.discard(lazy_function)
+        return validated_function
+
+    if inspect.iscoroutinefunction(function) and not hasattr(
+        inspect, "markcoroutinefunction"
+    ):
+        # (See `_make_coroutine_function`).
+
+        @wraps(function)
+        async def lazy_function(*args, **kwargs):
+            return await (validated_function or compile_validation())(*args, **kwargs)
+
+    else:
+
+        @wraps(function)
+        def lazy_function(*args, **kwargs):
+            return (validated_function or compile_validation())(*args, **kwargs)
+
+        if inspect.iscoroutinefunction(function):
+            inspect.markcoroutinefunction(lazy_function)
+
+    lazy_function.compile_validation = compile_validation
+    with _pending_functions_lock:
+        _pending_functions.add(lazy_function)
+    return lazy_function
+
+
+def preflight(*functions: Callable) -> int:
+    """
+    Compiles the validation of the given lazily validated functions now (or of
+    all that have not been compiled yet, when no functions are given), so that
+    e.g. invalid default values are reported right away. Returns the number of
+    functions that were compiled.
+    """
+    if not functions:
+        with _pending_functions_lock:
+            functions = tuple(_pending_functions)
+    num_compiled = 0
+    for function in functions:
+        is_compiled = hasattr(function, "check_plan")
+        if not is_compiled:
+            function.compile_validation()
+            num_compiled += 1
+    return num_compiled
+
+
+def _make_coroutine_function(
+    validated_function: Callable,
+    function: Callable,
+    returned_value_check: Optional[Callable[[Any], Any]],
+) -> Callable:
+    if hasattr(inspect, "markcoroutinefunction"):
+        # Arguments are checked right away when the function is called (as for
+        # other functions), and the original coroutine is returned.
+
+        @wraps(function)
+        def coroutine_function(*args, **kwargs):
+            coroutine = validated_function(*args, **kwargs)
+            if (returned_value_check is None) or (_check_every == 0):
+                return coroutine
+            else:
+                return _check_awaited_value(coroutine, returned_value_check)
+
+        return inspect.markcoroutinefunction(coroutine_function)
+
+    # Before Python 3.12, only `async def` functions are recognised as
+    # coroutine functions. Arguments are then checked when the returned
+    # coroutine is first awaited.
+
+    @wraps(function)
+    async def coroutine_function(*args, **kwargs):
+        value = await validated_function(*args, **kwargs)
+        if (returned_value_check is None) or (_check_every == 0):
+            return value
+        else:
+            return returned_value_check(value)
+
+    return coroutine_function
+
+
+async def _check_awaited_value(
+    coroutine: Awaitable, returned_value_check: Callable[[Any], Any]
+) -> Any:
+    return returned_value_check(await coroutine)
+
+
+def _make_async_generator_function(
+    validated_function: Callable, function: Callable, check_item: Optional[Checker]
+) -> Callable:
+    @wraps(function)
+    async def async_generator_function(*args, **kwargs):
+        # Values sent to, and exceptions thrown into this generator are passed
+        # on to the wrapped one (cf. `_check_yielded_items`).
+        async_generator = validated_function(*args, **kwargs)
+        if _check_every == 0:
+            check = None
+        else:
+            check = check_item
+        sent_value = None
+        thrown_error = None
+        while True:
+            try:
+                if thrown_error is None:
+                    item = await async_generator.asend(sent_value)
+                else:
+                    item = await async_generator.athrow(thrown_error)
+            except StopAsyncIteration:
+                return
+            if check is not None:
+                _check_item(item, check, function)
+            try:
+                sent_value = yield item
+                thrown_error = None
+            except GeneratorExit:
+                await async_generator.aclose()
+                raise
+            except BaseException as error:
+                thrown_error = error
+
+    return async_generator_function
+
+
+def get_check_cache_info(function: Callable) -> Dict[str, Any]:
+    """
+    Hit, miss and size statistics of the argument check caches of a function
+    decorated with `validate_inputs(cache_size=...)`, per parameter. (With
+    `coerce=True`, these are the caches of canonical values).
+    """
+    if hasattr(function, "compile_validation"):
+        function.compile_validation()
+    plan = function.check_plan
+    param_checks = list(plan.by_name.values()) + [plan.varargs, plan.varkw]
+    cache_infos = {}
+    for param_check in param_checks:
+        if param_check is None:
+            continue
+        for cached_function in (param_check.check, param_check.coerce):
+            if hasattr(cached_function, "cache_info"):
+                cache_infos[param_check.name] = cached_function.cache_info()
+    return cache_infos
+
+
+class ParameterStats:
+    """
+    Validation statistics of one parameter of an instrumented function.
+    Durations are in nanoseconds.
+
+    Can be updated from several threads at once.
+    """
+
+    num_samples = 1000
+    # Percentiles are calculated over the durations of this many most recent
+    # checks.
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.num_checks = 0
+            self.num_failures = 0
+            self.total_time = 0
+            self.recent_times = deque(maxlen=self.num_samples)
+
+    def record(self, duration: int, valid: bool) -> None:
+        with self._lock:
+            self.num_checks += 1
+            if not valid:
+                self.num_failures += 1
+            self.total_time += duration
+            self.recent_times.append(duration)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            times = sorted(self.recent_times)
+            return {
+                "checks": self.num_checks,
+                "failures": self.num_failures,
+                "total_time_ns": self.total_time,
+                "p50_ns": _percentile(times, 50),
+                "p90_ns": _percentile(times, 90),
+                "p99_ns": _percentile(times, 99),
+            }
+
+
+class FunctionStats:
+    """
+    Validation statistics of an instrumented function.
+
+    Can be updated from several threads at once.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.parameters: Dict[str, ParameterStats] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.num_calls = 0
+            self.num_failures = 0
+            #     Calls that raised an ArgumentError for this function.
+        for param_stats in list(self.parameters.values()):
+            param_stats.reset()
+
+    def record_call(self, failed: bool = False) -> None:
+        with self._lock:
+            self.num_calls += 1
+            if failed:
+                self.num_failures += 1
+
+    def get_parameter_stats(self, arg_name: str) -> ParameterStats:
+        return self.parameters.setdefault(arg_name, ParameterStats())
+
+    @property
+    def total_time(self) -> int:
+        return sum(
+            param_stats.total_time for param_stats in list(self.parameters.values())
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.num_calls,
+            "failures": self.num_failures,
+            "total_time_ns": self.total_time,
+            "parameters": {
+                arg_name: param_stats.as_dict()
+                for arg_name, param_stats in list(self.parameters.items())
+            },
+        }
+
+
+_function_stats: Dict[str, FunctionStats] = {}
+# Statistics of all instrumented functions, by qualified name.
+
+
+def _get_function_stats(function: Callable) -> FunctionStats:
+    name = f"{function.__module__}.{function.__qualname__}"
+    return _function_stats.setdefault(name, FunctionStats())
 
-    return checked_function
+
+def get_validation_stats() -> Dict[str, FunctionStats]:
+    """
+    Validation statistics of all instrumented functions, by qualified name.
+    """
+    return dict(_function_stats)
+
+
+def dump_validation_stats(file: Optional[TextIO] = None) -> str:
+    """
+    Returns the validation statistics of all instrumented functions as JSON,
+    and writes them to `file`, if given.
+    """
+    text = json.dumps(
+        {name: stats.as_dict() for name, stats in list(_function_stats.items())},
+        indent=2,
+    )
+    if file is not None:
+        file.write(text)
+    return text
+
+
+def reset_validation_stats() -> None:
+    """
+    Sets all validation statistics back to zero.
+    """
+    for stats in list(_function_stats.values()):
+        stats.reset()
+
+
+def _percentile(sorted_values: List[int], percent: float) -> Optional[int]:
+    if not sorted_values:
+        return None
+    index = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+def _get_timed_checker(check: Checker, stats: ParameterStats) -> Checker:
+    def timed_check(value: Any) -> bool:
+        start = perf_counter_ns()
+        valid = check(value)
+        stats.record(perf_counter_ns() - start, valid)
+        return valid
+
+    # Keep attributes such as `cache_info` accessible.
+    timed_check.__dict__.update(getattr(check, "__dict__", {}))
+    timed_check.untimed = check
+    return timed_check
+
+
+def _get_timed_coercer(coerce: Coercer, stats: ParameterStats) -> Coercer:
+    def timed_coerce(value: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            cast = coerce(value)
+        except (CastingError, SpecificationError):
+            stats.record(perf_counter_ns() - start, valid=False)
+            raise
+        stats.record(perf_counter_ns() - start, valid=True)
+        return cast
+
+    timed_coerce.__dict__.update(getattr(coerce, "__dict__", {}))
+    timed_coerce.untimed = coerce
+    return timed_coerce
+
+
+def _get_untimed(function: Callable) -> Callable:
+    """ The checker or coercer wrapped by a timed one (or the given one). """
+    return getattr(function, "untimed", function)
+
+
+def _count_calls(
+    validated_function: Callable, function: Callable, stats: FunctionStats
+) -> Callable:
+    @wraps(function)
+    def counted_function(*args, **kwargs):
+        try:
+            value = validated_function(*args, **kwargs)
+        except ArgumentError as error:
+            # (Errors raised by other validated functions, called by this
+            # function, do not count).
+            stats.record_call(failed=error.function is function)
+            raise
+        except BaseException:
+            stats.record_call()
+            raise
+        stats.record_call()
+        return value
+
+    return counted_function
+
+
+def collect_argument_errors(
+    function: Callable, plan: CheckPlan, args: tuple, kwargs: dict
+) -> List["ArgumentError"]:
+    """
+    Checks all arguments of a function call, and returns an ArgumentError for
+    every invalid one.
+    """
+    errors = []
+
+    def check(param_check: ParameterCheck, value: Any):
+        try:
+            param_check.coerce(value)
+        except (CastingError, SpecificationError) as reason:
+            errors.append(ArgumentError(function, param_check.name, value, reason))
+
+    num_args = len(args)
+    for param_check in plan.positional:
+        if param_check.index < num_args:
+            check(param_check, args[param_check.index])
+    if plan.varargs is not None:
+        for index in range(plan.varargs.index, num_args):
+            check(plan.varargs, args[index])
+    for keyword, value in kwargs.items():
+        param_check = plan.keyword.get(keyword, plan.varkw)
+        if param_check is not None:
+            check(param_check, value)
+    return errors
 
 
 def check_arg(function: Callable, arg_name: str, value: Any) -> None:
@@ -57,29 +1199,164 @@ def check_arg(function: Callable, arg_name: str, value: Any) -> None:
 
 
 class ArgumentError(Exception):
-    """ Raised when a function is called with an invalid argument. """
+    """
+    Raised when a function is called with an invalid argument.
+
+    Creating the error is cheap: the message is only rendered (and then
+    cached) when the error is printed.
+    """
 
-    def __init__(self, function: Callable, arg_name: str, value: Any):
+    def __init__(
+        self,
+        function: Callable,
+        arg_name: str,
+        value: Any,
+        reason: Optional[Exception] = None,
+        #     The CastingError or SpecificationError that made the argument
+        #     invalid, if known. Else, it is determined when needed.
+    ):
         self.function = function
         self.arg_name = arg_name
         self.value = value
+        self._reason = reason
+        self._message = None
+
+    @property
+    def annotation(self) -> Any:
+        return self.function.__annotations__.get(self.arg_name)
+
+    @property
+    def reason(self) -> Optional[Exception]:
+        """
+        The CastingError or SpecificationError that made the argument invalid.
+        """
+        if self._reason is None:
+            coerce = get_coercer(self.annotation)
+            try:
+                if coerce is not None:
+                    coerce(self.value)
+            except (CastingError, SpecificationError) as reason:
+                self._reason = reason
+        return self._reason
+
+    def describe_reason(self) -> str:
+        reason = self.reason
+        if isinstance(reason, CastingError):
+            downstream_error = reason.downstream_error
+            if downstream_error is None:
+                return "Could not be cast to the canonical type."
+            else:
+                return (
+                    f"Could not be cast to the canonical type: "
+                    f"{type(downstream_error).__name__}: {downstream_error}"
+                )
+        elif isinstance(reason, SpecificationError) and reason.args:
+            return f"Does not match the annotation: {reason}"
+        else:
+            return "Does not match the annotation."
+
+    def as_dict(self) -> Dict[str, str]:
+        """
+        The details of the error, as strings, for machine consumption (e.g.
+        structured logging).
+        """
+        return {
+            "function": f"{self.function.__module__}.{self.function.__qualname__}",
+            "parameter": self.arg_name,
+            "annotation": pretty_str(self.annotation),
+            "value_type": pretty_str(type(self.value)),
+            "value": short_str(self.value),
+            "reason": self.describe_reason(),
+        }
 
     def __repr__(self) -> str:
-        func_name = self.function.__qualname__
-        annotation = self.function.__annotations__.get(self.arg_name)
-        labelled_annotation = f"Annotation: {pretty_str(annotation)}"
+        if self._message is None:
+            self._message = self.render_message()
+        return self._message
+
+    # Must override __str__ of Exception to get nice print in tracebacks.
+    __str__ = __repr__
+
+    def render_message(self) -> str:
+        labelled_annotation = f"Annotation: {pretty_str(self.annotation)}"
         lines = (
-            (
-                f"Argument `{self.arg_name}` of {func_name} did not match "
-                f"its parameter annotation."
-            ),
+            self.get_summary(),
             "",
             textwrap.fill(labelled_annotation, width=50),
             "",
-            f"Got argument of type `{pretty_str(type(self.value))}` and value:",
-            pretty_str(self.value),
+            f"Got {self.value_label} of type `{pretty_str(type(self.value))}` "
+            f"and value:",
+            short_str(self.value),
         )
+        reason = self.reason
+        if isinstance(reason, CastingError) or (
+            isinstance(reason, SpecificationError) and reason.args
+        ):
+            lines += ("", self.describe_reason())
         return "\n".join(lines)
 
-    # Must override __str__ of Exception to get nice print in tracebacks.
-    __str__ = __repr__
+    value_label = "argument"
+
+    def get_summary(self) -> str:
+        func_name = self.function.__qualname__
+        return (
+            f"Argument `{self.arg_name}` of {func_name} did not match "
+            f"its parameter annotation."
+        )
+
+
+class ReturnValueError(ArgumentError):
+    """
+    Raised when a function returns (or yields) a value that does not match its
+    return annotation.
+    """
+
+    def __init__(self, function: Callable, value: Any):
+        super().__init__(function, "return", value)
+
+    @property
+    def reason(self) -> Optional[Exception]:
+        # The annotation may be of an iterator, and the value one of its items.
+        # So the reason cannot be determined from the annotation and the value
+        # alone.
+        return self._reason
+
+    value_label = "value"
+
+    def get_summary(self) -> str:
+        func_name = self.function.__qualname__
+        return f"Value returned by {func_name} did not match its return annotation."
+
+
+class ArgumentErrors(ArgumentError):
+    """
+    Raised by functions decorated with `validate_inputs(collect_errors=True)`,
+    when they are called with invalid arguments. Lists all of them, in
+    `errors`.
+    """
+
+    def __init__(self, function: Callable, errors: List[ArgumentError]):
+        first_error = errors[0]
+        super().__init__(function, first_error.arg_name, first_error.value)
+        self.errors = errors
+
+    @property
+    def reason(self) -> Optional[Exception]:
+        return self.errors[0].reason
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "function": f"{self.function.__module__}.{self.function.__qualname__}",
+            "errors": [error.as_dict() for error in self.errors],
+        }
+
+    def render_message(self) -> str:
+        func_name = self.function.__qualname__
+        arg_names = ", ".join(f"`{error.arg_name}`" for error in self.errors)
+        summary = (
+            f"{len(self.errors)} argument(s) of {func_name} did not match their "
+            f"parameter annotation: {arg_names}."
+        )
+        messages = (error.render_message() for error in self.errors)
+        separator = "\n\n" + 20 * "-" + "\n\n"
+        return summary + separator + separator.join(messages)
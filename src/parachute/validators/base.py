@@ -1,8 +1,41 @@
-from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Any, Optional, Tuple
+from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Mapping, Sequence as SequenceABC, Collection
+from functools import lru_cache, wraps, partial
+from itertools import islice
+from random import Random
+from threading import RLock
+from weakref import WeakValueDictionary
+from typing import (
+    TypeVar,
+    Generic,
+    Any,
+    Optional,
+    Tuple,
+    Callable,
+    Dict,
+    Iterable,
+    Sequence,
+    List,
+    Type,
+    FrozenSet,
+)
 
 import parachute.util as util
 
+__all__ = [
+    "CastingError",
+    "SpecificationError",
+    "CanonicalParamType",
+    "FrozenClassMeta",
+    "ValidatedArgument",
+    "interned",
+    "get_validator_cache_info",
+    "clear_validator_cache",
+    "validate_many",
+    "either",
+    "sampled",
+]
+
 
 class CastingError(Exception):
     """
@@ -14,6 +47,13 @@ class CastingError(Exception):
         self.downstream_error = downstream_error
 
 
+class SpecificationError(Exception):
+    """
+    Raised when a function argument, after casting, does not satisfy the
+    specification of the corresponding function parameter.
+    """
+
+
 CanonicalParamType = TypeVar("CanonicalParamType")
 # The canonical parameter type is the `main` type of a function argument.
 # Consider for example an argument that may be both an np.ndarray, a tuple, and
@@ -21,7 +61,34 @@ CanonicalParamType = TypeVar("CanonicalParamType")
 # is the canonical parameter type.
 
 
-class ValidatedArgument(ABC, Generic[CanonicalParamType]):
+class FrozenClassMeta(ABCMeta):
+    """
+    Metaclass of validator classes. Their attributes (such as the
+    specification they check against) cannot be changed after the class is
+    created, so that validators can be shared freely between threads.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        type.__setattr__(cls, "_is_frozen", True)
+        return cls
+
+    def __setattr__(cls, name: str, value: Any):
+        if "_is_frozen" in cls.__dict__:
+            raise AttributeError(
+                f"Cannot set `{name}`: validator classes are immutable."
+            )
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name: str):
+        if "_is_frozen" in cls.__dict__:
+            raise AttributeError(
+                f"Cannot delete `{name}`: validator classes are immutable."
+            )
+        super().__delattr__(name)
+
+
+class ValidatedArgument(ABC, Generic[CanonicalParamType], metaclass=FrozenClassMeta):
     def __new__(cls, argument: Any):
         """
         Return a new ValidatedArgument instance, populated with the given
@@ -60,6 +127,44 @@ class ValidatedArgument(ABC, Generic[CanonicalParamType]):
         """
         return self.cast_was_succesful and self.is_to_spec()
 
+    @classmethod
+    def check(cls, argument: Any) -> bool:
+        """
+        Whether the argument is valid, i.e. the same as
+        `cls(argument).is_valid()`.
+
+        This default implementation instantiates the class. Subclasses
+        override it with a faster implementation that does not.
+        """
+        return cls(argument).is_valid()
+
+    @classmethod
+    def check_many(cls, arguments: Iterable) -> Sequence[bool]:
+        """
+        Checks many arguments at once. Returns, for each argument, whether it
+        is valid (a boolean mask).
+
+        This default implementation calls `check` for every argument. Some
+        subclasses override it with a vectorised implementation, which returns
+        a NumPy boolean array.
+        """
+        return [cls.check(argument) for argument in arguments]
+
+    @classmethod
+    def coerce(cls, argument: Any) -> CanonicalParamType:
+        """
+        Cast the argument to the canonical parameter type, and return the cast
+        value (a plain instance of the canonical parameter type, not of this
+        class).
+
+        Raises a CastingError when the argument cannot be cast, and a
+        SpecificationError when the cast value is not to spec.
+        """
+        value = cls.cast(argument)
+        if not cls.get_populated_instance(value).is_to_spec():
+            raise SpecificationError
+        return value
+
     @classmethod
     @abstractmethod
     def cast(cls, argument: Any) -> CanonicalParamType:
@@ -130,14 +235,144 @@ class ValidatedArgument(ABC, Generic[CanonicalParamType]):
         return canonical_param_type
 
 
+_interned_factories: Dict[str, Callable] = {}
+
+
+def interned(maxsize: int = 256):
+    """
+    Decorator for functions that create ValidatedArgument subclasses.
+
+    Makes the decorated function return the same class object when called
+    again with the same (hashable) specification, instead of creating a new
+    class on every call. At most `maxsize` classes are kept per function.
+
+    This also holds when the function is first called from several threads at
+    once: only the (rare) creation of a class takes a lock, cache hits do not.
+    """
+
+    def decorator(make_class: Callable) -> Callable:
+        lock = RLock()
+        live_classes = WeakValueDictionary()
+        #     Classes made by this function, that are still in use. Makes sure
+        #     that threads that miss the cache at the same time get the same
+        #     class.
+
+        def make_class_once(key: tuple, args: tuple, kwargs: tuple):
+            with lock:
+                cls = live_classes.get(key)
+                if cls is None:
+                    cls = make_class(*args, **dict(kwargs))
+                    live_classes[key] = cls
+            return cls
+
+        cached_make_class = lru_cache(maxsize)(make_class_once)
+
+        @wraps(make_class)
+        def interned_make_class(*args, **kwargs):
+            kwargs_items = tuple(kwargs.items())
+            try:
+                hash((args, kwargs_items))
+            except TypeError:
+                # Unhashable specification: cannot be cached.
+                return make_class(*args, **kwargs)
+            key = _get_spec_key((args, kwargs_items))
+            return cached_make_class(key, args, kwargs_items)
+
+        def cache_clear():
+            with lock:
+                cached_make_class.cache_clear()
+                live_classes.clear()
+
+        interned_make_class.cache_info = cached_make_class.cache_info
+        interned_make_class.cache_clear = cache_clear
+        _interned_factories[make_class.__qualname__] = interned_make_class
+        return interned_make_class
+
+    return decorator
+
+
+def _get_spec_key(spec: Any) -> tuple:
+    """
+    A key that identifies a (hashable) specification, including the types of
+    all values in it, also those nested in tuples. (So that e.g. `either(1)`
+    and `either(True)`, or `shape((2, 2))` and `shape((2, 2.0))`, are different
+    classes, although their specifications are equal).
+    """
+    spec_type = type(spec)
+    if spec_type is tuple:
+        return (spec_type, tuple(map(_get_spec_key, spec)))
+    elif spec_type is frozenset:
+        return (spec_type, frozenset(map(_get_spec_key, spec)))
+    else:
+        return (spec_type, spec)
+
+
+def get_validator_cache_info() -> Dict[str, Any]:
+    """
+    Hit, miss and size statistics of the caches of interned validator
+    classes, per factory.
+    """
+    return {name: factory.cache_info() for name, factory in _interned_factories.items()}
+
+
+def clear_validator_cache() -> None:
+    """
+    Empties all caches of interned validator classes.
+    """
+    for factory in _interned_factories.values():
+        factory.cache_clear()
+
+
+def validate_many(Validator: Type[ValidatedArgument], arguments: Iterable) -> List[int]:
+    """
+    Checks many arguments against the same validator. Returns the indices of
+    the invalid arguments.
+    """
+    mask = Validator.check_many(arguments)
+    if hasattr(mask, "nonzero"):
+        # A NumPy boolean array.
+        return (~mask).nonzero()[0].tolist()
+    else:
+        return [i for (i, valid) in enumerate(mask) if not valid]
+
+
 def either(*options):
     """
     Checks whether the function argument matches one of the given options.
     """
+    return _make_choice_class(*options)
+
+
+@interned()
+def _make_choice_class(*options):
+    # Sort the options by how they can be checked most efficiently.
+    literal_options = []
+    type_options = []
+    option_checks = []
+    for option in options:
+        if util.is_of_type(option, ValidatedArgument):
+            option_checks.append(option.check)
+        elif util.is_literal(option):
+            if _is_hashable(option):
+                literal_options.append(option)
+            else:
+                option_checks.append(partial(_equals, option))
+        else:
+            instance_types = util.get_instance_types(option)
+            if instance_types is None:
+                option_checks.append(util.get_type_checker(option))
+            else:
+                type_options.extend(instance_types)
 
     class Choice(ValidatedArgument[Any]):
 
         options_: Tuple[Any, ...] = options
+        literal_options_: FrozenSet[Any] = frozenset(literal_options)
+        #     Looked up in O(1).
+        type_options_: Tuple[type, ...] = tuple(type_options)
+        #     Checked with a single `isinstance` call.
+        option_checks_: Tuple[Callable[[Any], bool], ...] = tuple(option_checks)
+        #     Checks for all other options, called one by one.
 
         @classmethod
         def get_annotation_str(cls):
@@ -158,19 +393,150 @@ def either(*options):
             return obj
 
         def is_to_spec(self) -> bool:
-            return any(
-                Choice.value_matches_option(self.value, option)
-                for option in self.options_
+            return self.check(self.value)
+
+        @classmethod
+        def check(cls, argument: Any) -> bool:
+            try:
+                if argument in cls.literal_options_:
+                    return True
+            except TypeError:
+                # Unhashable argument.
+                pass
+            return isinstance(argument, cls.type_options_) or any(
+                check_option(argument) for check_option in cls.option_checks_
             )
 
-        @staticmethod
-        def value_matches_option(value: Any, option: Any) -> bool:
-            """ Whether a value is a valid input for an option. """
-            if util.is_of_type(option, ValidatedArgument):
-                return option(value).is_valid()
-            elif util.is_literal(option):
-                return value == option
+    return Choice
+
+
+def sampled(
+    annotation: Any,
+    #     A container type with a single element type, such as `List[int]`,
+    #     `Tuple[float, ...]`, `Sequence[str]`, `Set[int]` or `Dict[str, int]`.
+    first: Optional[int] = None,
+    #     Check only the first this many elements.
+    random: Optional[int] = None,
+    #     Check only this many elements, drawn at random (without replacement)
+    #     on every check. For containers that cannot be indexed (such as sets),
+    #     the first this many elements are checked instead.
+):
+    """
+    Checks whether the argument is a container of the right type, and whether
+    (some of) its elements are of the right type. When neither `first` nor
+    `random` is given, all elements are checked.
+
+    Checking only a sample of the elements makes the check of huge containers
+    take constant time.
+    """
+    if (first is not None) and (random is not None):
+        raise ValueError("Specify at most one of `first` and `random`.")
+    return _make_sampled_class(annotation, first, random)
+
+
+@interned()
+def _make_sampled_class(
+    annotation: Any, first: Optional[int], num_random: Optional[int]
+):
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", None) or ()
+    if (origin is tuple) and (len(args) == 2) and (args[1] is Ellipsis):
+        args = args[:1]
+    if not (
+        isinstance(origin, type)
+        and issubclass(origin, Collection)
+        and (len(args) == (2 if issubclass(origin, Mapping) else 1))
+    ):
+        msg = f"Cannot sample the elements of {util.pretty_str(annotation)}."
+        raise TypeError(msg)
+    element_checks = tuple(_get_element_checker(arg) for arg in args)
+    if issubclass(origin, Mapping):
+        check_element = lambda item: (
+            element_checks[0](item[0]) and element_checks[1](item[1])
+        )
+        get_elements = lambda mapping: mapping.items()
+    else:
+        check_element = element_checks[0]
+        get_elements = lambda container: container
+    if first is not None:
+        num_elements = first
+    else:
+        num_elements = num_random
+
+    class Sampled(ValidatedArgument[Any]):
+
+        annotation_: Any = annotation
+        container_type_: type = origin
+        first_: Optional[int] = first
+        random_: Optional[int] = num_random
+
+        @classmethod
+        def get_annotation_str(cls) -> str:
+            if first is not None:
+                sample = f"first {first} elements checked"
+            elif num_random is not None:
+                sample = f"{num_random} random elements checked"
             else:
-                return util.is_of_type(value, option)
+                sample = "all elements checked"
+            return f"{util.pretty_str(annotation)} ({sample})"
 
-    return Choice
+        @classmethod
+        def cast(cls, argument: Any):
+            """ Do not attempt any casting. """
+            return argument
+
+        @classmethod
+        def get_populated_instance(cls, value):
+            obj = object.__new__(cls)
+            obj.value = value
+            return obj
+
+        def is_to_spec(self) -> bool:
+            return self.check(self.value)
+
+        @classmethod
+        def check(cls, argument: Any) -> bool:
+            if not isinstance(argument, origin):
+                return False
+            if num_elements is None:
+                elements = get_elements(argument)
+            elif (num_random is not None) and isinstance(argument, SequenceABC):
+                size = len(argument)
+                if size > num_elements:
+                    indices = _random.sample(range(size), num_elements)
+                    elements = (argument[i] for i in indices)
+                else:
+                    elements = argument
+            else:
+                elements = islice(get_elements(argument), num_elements)
+            return all(check_element(element) for element in elements)
+
+    return Sampled
+
+
+_random = Random()
+# Draws the elements to check for `sampled(..., random=K)`.
+
+
+def _get_element_checker(annotation: Any) -> Callable[[Any], bool]:
+    if isinstance(annotation, type) and issubclass(annotation, ValidatedArgument):
+        return annotation.check
+    else:
+        return util.get_type_checker(annotation)
+
+
+def _equals(option: Any, value: Any) -> bool:
+    try:
+        return bool(value == option)
+    except ValueError:
+        # Comparing e.g. a NumPy array to a literal yields an array of
+        # booleans, which has no single truth value.
+        return False
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
@@ -1,14 +1,55 @@
-from typing import Union, Tuple, Type, Optional, Any
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from typing import (
+    Union,
+    Tuple,
+    Type,
+    Optional,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    NamedTuple,
+)
 
 import numpy as np
 from parachute.util import is_of_type, pretty_str
 
-from .base import ValidatedArgument, CastingError, either
+from .base import (
+    ValidatedArgument,
+    CastingError,
+    SpecificationError,
+    either,
+    interned,
+)
+
+__all__ = [
+    "Arbitrary",
+    "DType",
+    "ShapeType",
+    "DimSizeSpec",
+    "ShapeSpec",
+    "dimsize",
+    "shape",
+    "compile_shape_spec",
+    "compile_dtype_spec",
+    "compile_layout_spec",
+    "compile_array_spec",
+    "compile_value_spec",
+    "array",
+    "vector",
+    "set_zero_copy_default",
+    "ValueSpec",
+    "ElementValueError",
+]
 
 # Special type to denote arbitrary shapes, dimension sizes, etc.
 Arbitrary = None
 
-DType = Union[Type[bool], Type[int], Type[float], Type[complex]]
+DType = Union[Type[bool], Type[int], Type[float], Type[complex], np.dtype]
 ShapeType = Tuple[int, ...]
 DimSizeSpec = Union[int, Arbitrary]
 ShapeSpec = Union[Tuple[DimSizeSpec, ...], Arbitrary]
@@ -19,7 +60,11 @@ def dimsize(spec: DimSizeSpec = Arbitrary):
     Check whether the argument can be cast to an integer, and whether it
     satisfies the given specification.
     """
+    return _make_dimsize_class(spec)
 
+
+@interned()
+def _make_dimsize_class(spec: DimSizeSpec):
     class DimSize(ValidatedArgument[int], int):
         dimsize_spec = spec
 
@@ -59,6 +104,33 @@ def dimsize(spec: DimSizeSpec = Arbitrary):
             else:
                 return self == self.dimsize_spec
 
+        @classmethod
+        def check(cls, argument: Any) -> bool:
+            try:
+                number = cls.cast(argument)
+            except CastingError:
+                return False
+            if cls.dimsize_spec is Arbitrary:
+                return True
+            else:
+                return number == cls.dimsize_spec
+
+        @classmethod
+        def check_many(cls, arguments: Iterable) -> Sequence[bool]:
+            """
+            Numeric arguments are checked in one go, as a NumPy array.
+            """
+            numbers = _as_numeric_array(arguments, ndim=1)
+            if numbers is None:
+                return super().check_many(arguments)
+            if numbers.dtype.kind == "f":
+                mask = np.isfinite(numbers) & (numbers == np.floor(numbers))
+            else:
+                mask = np.ones(numbers.shape, dtype=bool)
+            if cls.dimsize_spec is not Arbitrary:
+                mask &= numbers == cls.dimsize_spec
+            return mask
+
     return DimSize
 
 
@@ -67,9 +139,16 @@ def shape(spec: ShapeSpec = Arbitrary):
     Check whether the argument is an array shape, that satisfies the given
     specification.
     """
+    if spec is not Arbitrary:
+        spec = tuple(spec)
+    return _make_shape_class(spec)
+
 
+@interned()
+def _make_shape_class(spec: ShapeSpec):
     class Shape(ValidatedArgument[tuple], tuple):
         shape_spec: ShapeSpec = spec
+        matches_spec_ = staticmethod(compile_shape_spec(spec))
 
         @classmethod
         def get_short_str(cls) -> str:
@@ -107,78 +186,694 @@ def shape(spec: ShapeSpec = Arbitrary):
                 return tup
 
         def is_to_spec(self):
-            if self.shape_spec is Arbitrary:
-                return True
-            elif len(self) != len(self.shape_spec):
+            return self.matches_spec_(self)
+
+        @classmethod
+        def check(cls, argument: Any) -> bool:
+            try:
+                tup = cls.cast(argument)
+            except CastingError:
                 return False
+            return cls.matches_spec_(tup)
+
+        @classmethod
+        def check_many(cls, arguments: Iterable) -> Sequence[bool]:
+            """
+            Shapes that are all of the same length can be checked in one go,
+            as the rows of a 2D integer NumPy array.
+            """
+            shapes = _as_numeric_array(arguments, ndim=2, kinds="biu")
+            if shapes is None:
+                return super().check_many(arguments)
+            num_shapes, ndim = shapes.shape
+            if cls.shape_spec is Arbitrary:
+                return np.ones(num_shapes, dtype=bool)
+            elif ndim != len(cls.shape_spec):
+                return np.zeros(num_shapes, dtype=bool)
             else:
-                return all(
-                    dimsize(dimsize_spec)(dimsize_).is_valid()
-                    for (dimsize_spec, dimsize_) in zip(self.shape_spec, self)
-                )
+                fixed_dims = [
+                    i
+                    for (i, dimsize_spec) in enumerate(cls.shape_spec)
+                    if dimsize_spec is not Arbitrary
+                ]
+                fixed_sizes = [cls.shape_spec[i] for i in fixed_dims]
+                return np.all(shapes[:, fixed_dims] == fixed_sizes, axis=1)
 
     return Shape
 
 
+def _as_numeric_array(
+    arguments: Iterable, ndim: int, kinds: str = "biuf"
+) -> Optional[np.ndarray]:
+    """
+    Convert a collection of arguments to a NumPy array with `ndim` dimensions
+    and a numeric dtype (of one of the given kinds), if possible. Else, return
+    None.
+    """
+    try:
+        array_ = np.asarray(arguments)
+    except (TypeError, ValueError):
+        return None
+    if (array_.ndim == ndim) and (array_.dtype.kind in kinds):
+        return array_
+    else:
+        return None
+
+
+def compile_shape_spec(spec: ShapeSpec) -> Callable[[ShapeType], bool]:
+    """
+    Turns a shape specification into a function that checks whether a given
+    shape (a tuple of integers) satisfies it.
+    """
+    if spec is Arbitrary:
+        return lambda shape_: True
+    elif Arbitrary not in spec:
+        # All dimension sizes are fixed: compare the shapes as a whole.
+        return lambda shape_: shape_ == spec
+    else:
+        ndim = len(spec)
+        fixed_dims = tuple(
+            (i, dimsize_spec)
+            for (i, dimsize_spec) in enumerate(spec)
+            if dimsize_spec is not Arbitrary
+        )
+        return lambda shape_: (len(shape_) == ndim) and all(
+            shape_[i] == dimsize_spec for (i, dimsize_spec) in fixed_dims
+        )
+
+
+def compile_dtype_spec(
+    dtype: DType, exact_dtype: bool, byteorder: Optional[str]
+) -> Callable[[np.dtype], bool]:
+    """
+    Turns a dtype specification into a function that checks whether a given
+    dtype satisfies it.
+    """
+    if exact_dtype:
+        dtype = np.dtype(dtype)
+        matches_dtype = lambda dtype_: dtype_ == dtype
+    else:
+        matches_dtype = lambda dtype_: np.can_cast(dtype_, dtype, casting="safe")
+    if byteorder is None:
+        return matches_dtype
+    else:
+        return lambda dtype_: matches_dtype(dtype_) and (
+            _get_byteorder(dtype_) in (byteorder, "|")
+        )
+
+
+def _get_byteorder(dtype: np.dtype) -> str:
+    """ One of "<", ">", or "|" (when not applicable). """
+    if dtype.byteorder == "=":
+        return _native_byteorder
+    else:
+        return dtype.byteorder
+
+
+_native_byteorder = "<" if sys.byteorder == "little" else ">"
+
+
+def compile_layout_spec(
+    contiguous: Optional[str], aligned: Optional[bool], writeable: Optional[bool]
+) -> Optional[Callable[[np.ndarray], bool]]:
+    """
+    Turns memory layout requirements into a function that checks whether a
+    given array satisfies them, using only its flags. Returns None when there
+    are no requirements.
+    """
+    if (contiguous, aligned, writeable) == (None, None, None):
+        return None
+    required_flags = []
+    if contiguous == "C":
+        required_flags.append(("c_contiguous", True))
+    elif contiguous == "F":
+        required_flags.append(("f_contiguous", True))
+    if aligned is not None:
+        required_flags.append(("aligned", aligned))
+    if writeable is not None:
+        required_flags.append(("writeable", writeable))
+    required_flags = tuple(required_flags)
+
+    def matches_layout(array_: np.ndarray) -> bool:
+        flags = array_.flags
+        if (contiguous == "any") and not (flags.c_contiguous or flags.f_contiguous):
+            return False
+        return all(getattr(flags, flag) == value for (flag, value) in required_flags)
+
+    return matches_layout
+
+
+def compile_array_spec(
+    matches_dtype: Callable[[np.dtype], bool],
+    matches_shape: Callable[[ShapeType], bool],
+    matches_layout: Optional[Callable[[np.ndarray], bool]],
+) -> Callable[[np.ndarray], bool]:
+    """
+    Combines the dtype, shape and memory layout checks of an array validator.
+    """
+    if matches_layout is None:
+        return lambda array_: matches_dtype(array_.dtype) and matches_shape(
+            array_.shape
+        )
+    else:
+        return lambda array_: (
+            matches_dtype(array_.dtype)
+            and matches_shape(array_.shape)
+            and matches_layout(array_)
+        )
+
+
 def array(
     dtype: DType = float,
-    #     Datatype of the numbers in the array.
+    #     Datatype of the numbers in the array. Either a Python type (`bool`,
+    #     `int`, `float` or `complex`), or anything that `np.dtype` accepts
+    #     (e.g. `np.float32`, `">i4"`, or a structured dtype).
     ndim: either(int, Arbitrary) = Arbitrary,
     #     Number of dimensions of the array. Ignored when a value is specified
     #     for `shape_spec`.
     shape_spec: Optional[ShapeSpec] = None,
     #     Shape of the array (e.g. `(10,10,2)` or `(2, Arbitrary)`).
+    zero_copy: Optional[bool] = None,
+    #     Whether ndarrays with a dtype that can be safely cast to `dtype` are
+    #     passed through as they are, instead of being converted to `dtype`.
+    #     When None, the global default is used (see `set_zero_copy_default`).
+    exact_dtype: bool = False,
+    #     If True, the argument must have exactly the given dtype, instead of
+    #     a dtype that can be safely cast to it.
+    byteorder: Optional[str] = None,
+    #     Required byte order of the array data: "<" (little-endian), ">"
+    #     (big-endian), or "=" (native).
+    contiguous: Optional[str] = None,
+    #     Required memory layout: "C" (row-major), "F" (column-major), or "any"
+    #     (either of both).
+    aligned: Optional[bool] = None,
+    #     Whether the array data must be aligned in memory.
+    writeable: Optional[bool] = None,
+    #     Whether the array must be writeable.
+    finite: bool = False,
+    #     If True, no element may be NaN or infinite.
+    min_value: Optional[float] = None,
+    #     Lower bound (inclusive) for the elements.
+    max_value: Optional[float] = None,
+    #     Upper bound (inclusive) for the elements.
+    nonnegative: bool = False,
+    #     If True, no element may be negative (as `min_value=0`).
+    monotonic: Optional[str] = None,
+    #     Required ordering of the elements along the first axis: one of
+    #     "increasing", "decreasing", "strictly increasing" and "strictly
+    #     decreasing".
+    parallel: Union[bool, int] = False,
+    #     Whether to check the element values of large arrays using several
+    #     threads (as many as there are CPUs if True, or the given number).
+    #     Requires at least one element value constraint.
 ):
     """
     Checks whether the argument is a scalar, a numeric vector, a numeric
     matrix, or in general, a numeric tensor, of the right shape and data type.
+
+    The exact dtype, byte order and memory layout requirements are checked on
+    the argument as it is passed (from its metadata, i.e. without looking at
+    the data), and arrays that meet them are passed through without copying
+    (i.e. they imply `zero_copy`).
+
+    The element value constraints (`finite`, `min_value`, etc.) are checked in
+    chunks that fit in the CPU cache, stopping at the first offending element.
+    Its index is given in the error message.
     """
     if (shape_spec is None) and (ndim is not Arbitrary):
         shape_spec = ndim * (Arbitrary,)
     elif shape_spec is None:
         shape_spec = Arbitrary
+    else:
+        shape_spec = tuple(shape_spec)
+    if dtype not in (bool, int, float, complex):
+        dtype = np.dtype(dtype)
+    if byteorder == "=":
+        byteorder = _native_byteorder
+    if byteorder not in (None, "<", ">"):
+        raise ValueError(f"Invalid byte order: {byteorder!r}")
+    if contiguous not in (None, "C", "F", "any"):
+        raise ValueError(f"Invalid memory layout: {contiguous!r}")
+    if nonnegative:
+        min_value = 0 if (min_value is None) else max(min_value, 0)
+    if monotonic not in (None, *_monotonic_comparisons):
+        raise ValueError(f"Invalid ordering: {monotonic!r}")
+    if parallel is True:
+        parallel = os.cpu_count() or 1
+    value_spec = ValueSpec(finite, min_value, max_value, monotonic, int(parallel))
+    if not value_spec.has_constraints():
+        if parallel:
+            raise ValueError(
+                "`parallel` only applies to element value constraints "
+                "(`finite`, `min_value`, etc.), and none are given."
+            )
+        value_spec = None
+    return _make_array_class(
+        dtype,
+        shape_spec,
+        zero_copy,
+        exact_dtype,
+        byteorder,
+        contiguous,
+        aligned,
+        writeable,
+        value_spec,
+    )
+
+
+_zero_copy_by_default = False
+
+
+def set_zero_copy_default(zero_copy: bool) -> None:
+    """
+    Sets whether array validators that were created without a `zero_copy`
+    value pass compatible ndarrays through without copying their data.
+    """
+    global _zero_copy_by_default
+    _zero_copy_by_default = zero_copy
+
+
+@interned()
+def _make_array_class(
+    dtype: DType,
+    shape_spec: ShapeSpec,
+    zero_copy: Optional[bool],
+    exact_dtype: bool = False,
+    byteorder: Optional[str] = None,
+    contiguous: Optional[str] = None,
+    aligned: Optional[bool] = None,
+    writeable: Optional[bool] = None,
+    value_spec: Optional["ValueSpec"] = None,
+):
+    layout_requirements = {
+        "exact dtype": exact_dtype or None,
+        "byte order": byteorder,
+        "contiguous": contiguous,
+        "aligned": aligned,
+        "writeable": writeable,
+    }
+    layout_requirements = {
+        name: value
+        for (name, value) in layout_requirements.items()
+        if value is not None
+    }
+    matches_shape = compile_shape_spec(shape_spec)
+    if value_spec is None:
+        find_violation = None
+    else:
+        find_violation = compile_value_spec(value_spec)
 
     class Array(ValidatedArgument[np.ndarray], np.ndarray):
         dtype_ = dtype
         shape_spec_ = shape_spec
+        zero_copy_ = zero_copy
+        exact_dtype_ = exact_dtype
+        byteorder_ = byteorder
+        contiguous_ = contiguous
+        aligned_ = aligned
+        writeable_ = writeable
+        value_spec_ = value_spec
+        has_layout_requirements_ = bool(layout_requirements)
+        shape_matches_spec_ = staticmethod(matches_shape)
+        matches_spec_ = staticmethod(
+            compile_array_spec(
+                compile_dtype_spec(dtype, exact_dtype, byteorder),
+                matches_shape,
+                compile_layout_spec(contiguous, aligned, writeable),
+            )
+        )
 
         @classmethod
         def get_annotation_str(cls) -> str:
-            return (
+            if isinstance(cls.dtype_, np.dtype):
+                dtype_str = str(cls.dtype_)
+            else:
+                dtype_str = pretty_str(cls.dtype_)
+            text = (
                 f"NumPy ndarray-like, with numeric type "
-                f"compatible to `{pretty_str(cls.dtype_)}`, "
-                f"and shape `{shape(cls.shape_spec_).get_short_str()}`."
+                f"compatible to `{dtype_str}`, "
+                f"and shape `{shape(cls.shape_spec_).get_short_str()}`"
             )
+            if cls.has_layout_requirements_:
+                requirements = ", ".join(
+                    _describe_requirement(name, value)
+                    for (name, value) in layout_requirements.items()
+                )
+                text += f" (requires: {requirements})"
+            if cls.value_spec_ is not None:
+                text += f"; values: {cls.value_spec_.describe()}"
+            return text + "."
 
         @classmethod
         def cast(cls, argument: Any) -> np.ndarray:
+            """
+            Convert the argument to an ndarray. Data is only copied when the
+            dtype has to change (and never in zero-copy mode, when the argument
+            already has a compatible dtype).
+
+            Objects that support the buffer protocol (such as `memoryview`,
+            `mmap.mmap` and `array.array` objects), and memory-mapped arrays of
+            the right dtype, are wrapped, not copied. (Memory-mapped arrays of
+            another dtype are read from disk in full, to be cast).
+            """
             try:
-                if not isinstance(argument, np.ndarray):
-                    argument = np.array(argument)
-                cast = argument.astype(cls.dtype_, casting="safe")
-                return cast
+                argument = np.asanyarray(argument)
+                if cls.is_zero_copy() and np.can_cast(
+                    argument.dtype, cls.dtype_, casting="safe"
+                ):
+                    return argument
+                else:
+                    return argument.astype(cls.dtype_, casting="safe", copy=False)
             except (TypeError, ValueError) as err:
                 raise CastingError(err)
 
+        @classmethod
+        def is_zero_copy(cls) -> bool:
+            if cls.has_layout_requirements_:
+                return True
+            elif cls.zero_copy_ is None:
+                return _zero_copy_by_default
+            else:
+                return cls.zero_copy_
+
         @classmethod
         def get_dummy_value(cls):
             return np.array([])
 
         @classmethod
         def get_populated_instance(cls, value: np.ndarray):
-            return np.ndarray.__new__(
-                cls, shape=value.shape, dtype=value.dtype, buffer=value
-            )
+            # A view: shares the data of `value`, whatever its memory layout.
+            return value.view(cls)
 
         def is_to_spec(self):
-            return shape(self.shape_spec_)(self.shape).is_valid()
+            return self.matches_spec_(self) and (
+                (find_violation is None) or (find_violation(self) is None)
+            )
+
+        @classmethod
+        def check(cls, argument: Any) -> bool:
+            """
+            Checks the dtype, shape and memory layout of the argument from its
+            metadata only, without casting or copying any data. (Element value
+            constraints, if any, are then checked on the data).
+            """
+            try:
+                argument = np.asanyarray(argument)
+            except (TypeError, ValueError):
+                return False
+            return cls.matches_spec_(argument) and (
+                (find_violation is None) or (find_violation(argument) is None)
+            )
+
+        @classmethod
+        def coerce(cls, argument: Any) -> np.ndarray:
+            """
+            As `ValidatedArgument.coerce`, but raises an `ElementValueError`
+            (naming the first offending element) when an element value
+            constraint is not met.
+            """
+            value = cls.cast(argument)
+            if not cls.matches_spec_(value):
+                raise SpecificationError
+            if find_violation is not None:
+                violation = find_violation(value)
+                if violation is not None:
+                    raise violation
+            return value
 
     return Array
 
 
-def vector(dtype: DType = float, length: DimSizeSpec = Arbitrary):
+class ValueSpec(NamedTuple):
+    """ Constraints on the element values of an array. """
+
+    finite: bool = False
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    monotonic: Optional[str] = None
+    parallel: int = 0
+    #     Number of threads to use (or 0, to not use a thread pool).
+
+    def has_constraints(self) -> bool:
+        return self._replace(parallel=0) != ValueSpec()
+
+    def describe(self) -> str:
+        constraints = []
+        if self.finite:
+            constraints.append("finite")
+        if self.min_value is not None:
+            constraints.append(f">= {self.min_value}")
+        if self.max_value is not None:
+            constraints.append(f"<= {self.max_value}")
+        if self.monotonic is not None:
+            constraints.append(self.monotonic)
+        return ", ".join(constraints)
+
+
+class ElementValueError(SpecificationError):
+    """
+    Raised when an element of an array argument does not satisfy the value
+    constraints of the corresponding parameter.
+    """
+
+    def __init__(self, index: Tuple[int, ...], constraint: str):
+        super().__init__(f"The element at index {index} is {constraint}.")
+        self.index = index
+        #     Index of the first offending element.
+        self.constraint = constraint
+
+
+_chunk_size = 2**15
+# Number of array elements checked at once. With 8-byte elements (and the
+# boolean temporaries of the checks), a chunk fits in a typical L2 cache.
+
+_monotonic_comparisons = {
+    "increasing": np.greater_equal,
+    "decreasing": np.less_equal,
+    "strictly increasing": np.greater,
+    "strictly decreasing": np.less,
+}
+
+
+def compile_value_spec(
+    spec: ValueSpec,
+) -> Callable[[np.ndarray], Optional[ElementValueError]]:
+    """
+    Turns element value constraints into a function that returns an
+    ElementValueError for the first element of a given array that does not
+    satisfy them (or None, when all elements do).
+    """
+    element_checks = []
+    #     Constraints, with functions that return where a chunk of the array
+    #     does not satisfy them.
+    if spec.finite:
+        element_checks.append(("not finite", lambda chunk: ~np.isfinite(chunk)))
+    if spec.min_value is not None:
+        element_checks.append(
+            (f"smaller than {spec.min_value}", lambda chunk: chunk < spec.min_value)
+        )
+    if spec.max_value is not None:
+        element_checks.append(
+            (f"larger than {spec.max_value}", lambda chunk: chunk > spec.max_value)
+        )
+    if spec.monotonic is None:
+        compare = None
+    else:
+        compare = _monotonic_comparisons[spec.monotonic]
+
+    def find_element_violation(
+        array_: np.ndarray, start: int, stop: int, cancelled: Optional[Event] = None
+    ) -> Optional[ElementValueError]:
+        # Checks the elements at flat positions `start` to `stop` (see
+        # `_iter_flat_chunks`).
+        order = _get_flat_order(array_)
+        for chunk_start, chunk in _iter_flat_chunks(array_, order, start, stop):
+            if (cancelled is not None) and cancelled.is_set():
+                return None
+            violations = []
+            for constraint, find_invalid in element_checks:
+                invalid = find_invalid(chunk)
+                if invalid.any():
+                    violations.append((chunk_start + int(invalid.argmax()), constraint))
+            if violations:
+                position, constraint = min(violations)
+                index = np.unravel_index(position, array_.shape, order=order)
+                return ElementValueError(tuple(map(int, index)), constraint)
+        return None
+
+    def find_monotonic_violation(
+        array_: np.ndarray, start: int, stop: int, cancelled: Optional[Event] = None
+    ) -> Optional[ElementValueError]:
+        # Compares rows `start` to `stop` with their preceding rows, a block of
+        # rows at a time.
+        row_size = array_.size // max(1, len(array_))
+        rows_per_chunk = max(1, _chunk_size // max(1, row_size))
+        for chunk_start in range(max(start, 1), stop, rows_per_chunk):
+            if (cancelled is not None) and cancelled.is_set():
+                return None
+            chunk_stop = min(chunk_start + rows_per_chunk, stop)
+            invalid = ~compare(
+                array_[chunk_start:chunk_stop], array_[chunk_start - 1 : chunk_stop - 1]
+            )
+            if invalid.any():
+                position = np.unravel_index(invalid.argmax(), invalid.shape)
+                index = (chunk_start + int(position[0]), *map(int, position[1:]))
+                return ElementValueError(
+                    index, f"not {spec.monotonic} along the first axis"
+                )
+        return None
+
+    def find_in_ranges(find_violation_in_range: Callable, array_, size: int):
+        if (spec.parallel > 1) and (array_.size > 4 * _chunk_size):
+            return _find_violation_in_parallel(
+                find_violation_in_range, array_, size, spec.parallel
+            )
+        else:
+            return find_violation_in_range(array_, 0, size)
+
+    def find_violation(array_: np.ndarray) -> Optional[ElementValueError]:
+        array_ = np.asarray(array_)
+        #     (A plain ndarray view, to not create validator instances).
+        is_scalar = array_.ndim == 0
+        if is_scalar:
+            array_ = array_.reshape(1)
+        violation = None
+        try:
+            if element_checks:
+                violation = find_in_ranges(find_element_violation, array_, array_.size)
+            if compare is not None:
+                if violation is None:
+                    num_rows = len(array_)
+                else:
+                    # Only rows up to the first invalid element can hold an
+                    # earlier violation.
+                    num_rows = violation.index[0] + 1
+                monotonic_violation = find_in_ranges(
+                    find_monotonic_violation, array_, num_rows
+                )
+                if (monotonic_violation is not None) and (
+                    (violation is None) or (monotonic_violation.index < violation.index)
+                ):
+                    violation = monotonic_violation
+        except TypeError:
+            # E.g. a structured dtype.
+            return ElementValueError((), "not comparable to the bounds")
+        if is_scalar and (violation is not None):
+            violation = ElementValueError((), violation.constraint)
+        return violation
+
+    return find_violation
+
+
+def _get_flat_order(array_: np.ndarray) -> str:
+    """
+    The order ("C" or "F") in which the elements of an array are checked: the
+    order in memory for contiguous arrays, and row-major otherwise.
+    """
+    if array_.flags.f_contiguous and not array_.flags.c_contiguous:
+        return "F"
+    else:
+        return "C"
+
+
+def _iter_flat_chunks(
+    array_: np.ndarray, order: str, start: int, stop: int
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yields the elements at flat positions `start` to `stop` of an array (in the
+    given order), in one-dimensional chunks of at most `_chunk_size` elements,
+    together with the flat position of their first element. The whole array is
+    never copied, whatever its shape: contiguous arrays are sliced, and other
+    arrays are read through a buffer of one chunk.
+    """
+    if array_.flags.c_contiguous or array_.flags.f_contiguous:
+        flat = array_.ravel(order)
+        #     (A view, as the order matches that in memory).
+        for chunk_start in range(start, stop, _chunk_size):
+            yield chunk_start, flat[chunk_start : min(chunk_start + _chunk_size, stop)]
+    elif start < stop:
+        iterator = np.nditer(
+            array_,
+            flags=["external_loop", "buffered", "ranged", "refs_ok", "zerosize_ok"],
+            op_flags=[["readonly"]],
+            order=order,
+            buffersize=_chunk_size,
+        )
+        iterator.iterrange = (start, stop)
+        chunk_start = start
+        for chunk in iterator:
+            yield chunk_start, chunk
+            chunk_start += len(chunk)
+
+
+def _find_violation_in_parallel(
+    find_violation_in_range: Callable,
+    array_: np.ndarray,
+    size: int,
+    num_threads: int,
+) -> Optional[ElementValueError]:
+    """
+    Splits the `size` positions (flat elements, or rows) of the array in
+    blocks, which are checked in a thread pool (NumPy releases the GIL while it
+    works). The first offending element of the first invalid block is returned;
+    later blocks are then cancelled.
+    """
+    executor = _get_executor(num_threads)
+    num_blocks = min(size, 4 * num_threads)
+    bounds = np.linspace(0, size, num_blocks + 1).astype(int)
+    cancelled = Event()
+    futures = [
+        executor.submit(find_violation_in_range, array_, start, stop, cancelled)
+        for (start, stop) in zip(bounds[:-1], bounds[1:])
+    ]
+    try:
+        for future in futures:
+            violation = future.result()
+            if violation is not None:
+                return violation
+        return None
+    finally:
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+
+
+_executors = {}
+_executors_lock = Lock()
+
+
+def _get_executor(num_threads: int) -> ThreadPoolExecutor:
+    """ A thread pool with the given number of threads, shared by all checks. """
+    with _executors_lock:
+        executor = _executors.get(num_threads)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                num_threads, thread_name_prefix="parachute-check"
+            )
+            _executors[num_threads] = executor
+        return executor
+
+
+def _describe_requirement(name: str, value: Any) -> str:
+    if value is True:
+        return name
+    elif value is False:
+        return f"not {name}"
+    else:
+        return f"{name} `{value}`"
+
+
+def vector(
+    dtype: DType = float,
+    length: DimSizeSpec = Arbitrary,
+    zero_copy: Optional[bool] = None,
+    **requirements,
+    #     Further requirements, as in `array`: on the dtype and memory layout
+    #     (such as `exact_dtype` or `contiguous`), and on the element values
+    #     (such as `min_value` or `monotonic`, and `parallel`).
+):
     """
     Checks whether the argument is a numeric vector of the right data type and
     length.
     """
-    return array(dtype, shape_spec=(length,))
+    return array(dtype, shape_spec=(length,), zero_copy=zero_copy, **requirements)
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import parachute
+
+
+def run_in_fresh_process(code: str) -> str:
+    process = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return process.stdout.strip()
+
+
+def test_heavy_modules_not_imported():
+    code = (
+        "import sys, parachute\n"
+        "@parachute.validate_inputs\n"
+        "def f(a: int, b: parachute.either('x', 'y') = 'x'): pass\n"
+        "f(1)\n"
+        "print('numpy' in sys.modules, 'typeguard' in sys.modules)"
+    )
+    assert run_in_fresh_process(code) == "False False"
+
+
+def test_numpy_imported_on_use():
+    code = "import sys, parachute; parachute.vector; print('numpy' in sys.modules)"
+    assert run_in_fresh_process(code) == "True"
+
+
+def test_ndarray_names_exposed():
+    import parachute.validators.ndarray as ndarray
+
+    assert set(ndarray.__all__) == set(parachute._ndarray_names)
+    for name in parachute._ndarray_names:
+        assert getattr(parachute, name) is getattr(ndarray, name)
+    assert "array" in dir(parachute)
+    assert "array" in parachute.__all__
+
+
+def test_only_own_names_exported():
+    for name in ("Callable", "Optional", "lru_cache", "inspect", "np", "util"):
+        assert name not in parachute.__all__
+    assert len(parachute.__all__) == len(set(parachute.__all__))
+    for name in parachute.__all__:
+        assert hasattr(parachute, name)
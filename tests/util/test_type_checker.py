@@ -0,0 +1,113 @@
+from typing import Union, Optional, Tuple, List, Dict, Any, Type, Sequence
+
+import typeguard
+
+from parachute import get_type_checker, compile_type_checker
+
+
+class A:
+    pass
+
+
+class B(A):
+    pass
+
+
+def conforms_to_typeguard(ttype, values):
+    check = compile_type_checker(ttype)
+    for value in values:
+        try:
+            typeguard.check_type("value", value, expected_type=ttype)
+            expected = True
+        except TypeError:
+            expected = False
+        assert check(value) == expected, (ttype, value)
+
+
+values = (
+    None,
+    True,
+    3,
+    4.2,
+    1j,
+    "jo",
+    b"jo",
+    bytearray(b"jo"),
+    (),
+    (1,),
+    (1, "a"),
+    (1, 2, 3),
+    [],
+    [1, 2],
+    [1, "a"],
+    {},
+    {"a": 1},
+    {1: "a"},
+    A(),
+    B(),
+)
+
+
+def test_plain_classes():
+    for ttype in (int, float, complex, str, bytes, bool, tuple, list, dict, A, B):
+        conforms_to_typeguard(ttype, values)
+
+
+def test_int_for_float():
+    assert get_type_checker(float)(3)
+    assert get_type_checker(complex)(3.0)
+    assert not get_type_checker(int)(3.0)
+
+
+def test_Union_and_Optional():
+    for ttype in (
+        Union[int, str],
+        Union[float, A],
+        Optional[int],
+        Optional[Tuple[int, str]],
+        Union[List[int], Dict[str, int]],
+    ):
+        conforms_to_typeguard(ttype, values)
+
+
+def test_containers():
+    for ttype in (
+        Tuple[int],
+        Tuple[int, str],
+        Tuple[int, ...],
+        Tuple[A, ...],
+        List[int],
+        List[Any],
+        Dict[str, int],
+        Dict[int, str],
+    ):
+        conforms_to_typeguard(ttype, values)
+
+
+def test_empty_tuple():
+    check = get_type_checker(Tuple[()])
+    assert check(())
+    assert not check((1,))
+    assert not check([])
+
+
+def test_Any():
+    for value in values:
+        assert get_type_checker(Any)(value)
+
+
+def test_typeguard_fallback():
+    for ttype in (Type[A], Sequence[int], Tuple, List):
+        conforms_to_typeguard(ttype, values + (A, B, int))
+
+
+def test_cached():
+    assert get_type_checker(Tuple[int, str]) is get_type_checker(Tuple[int, str])
+
+
+def test_Literal():
+    from typing import Literal
+
+    check = get_type_checker(Literal["a", "b"])
+    assert check("a")
+    assert not check("c")
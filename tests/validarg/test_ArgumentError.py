@@ -23,3 +23,34 @@ Got argument of type `str` and value:
 
 def test_repr():
     assert str(error) == expected_msg
+
+
+def test_message_cached():
+    error = ArgumentError(my_function, "array_size", "99")
+    assert error._message is None
+    message = str(error)
+    assert str(error) is message
+
+
+def test_large_value_summarised():
+    error = ArgumentError(my_function, "array_size", list(range(10_000)))
+    assert len(str(error)) < len(expected_msg) + 100
+    assert str(error).endswith("...]")
+
+
+def test_large_array_summarised():
+    import numpy as np
+
+    error = ArgumentError(my_function, "array_size", np.zeros((1000, 3)))
+    assert str(error).endswith("ndarray of shape (1000, 3) and dtype float64")
+
+
+def test_as_dict():
+    assert error.as_dict() == {
+        "function": f"{__name__}.my_function",
+        "parameter": "array_size",
+        "annotation": "int",
+        "value_type": "str",
+        "value": "'99'",
+        "reason": "Does not match the annotation.",
+    }
@@ -0,0 +1,103 @@
+import asyncio
+import inspect
+from typing import AsyncIterator, AsyncGenerator
+
+import pytest
+
+from parachute import (
+    validate_inputs,
+    ArgumentError,
+    ReturnValueError,
+    set_validation,
+    either,
+)
+
+
+@validate_inputs(check_return=True)
+async def double(x: int) -> int:
+    await asyncio.sleep(0)
+    return 2 * x if x < 10 else "too large"
+
+
+@validate_inputs(check_return=True)
+async def count_up(n: int) -> AsyncIterator[either(0, 1, 2)]:
+    for i in range(n):
+        yield i
+
+
+@validate_inputs
+async def echo(n: int) -> AsyncGenerator[int, str]:
+    reply = None
+    for i in range(n):
+        reply = yield (i if reply is None else reply)
+
+
+async def collect(async_generator):
+    return [item async for item in async_generator]
+
+
+def test_stays_async():
+    assert inspect.iscoroutinefunction(double)
+    assert inspect.isasyncgenfunction(count_up)
+    assert double.__name__ == "double"
+
+
+def test_coroutine():
+    assert asyncio.run(double(2)) == 4
+    with pytest.raises(ArgumentError):
+        asyncio.run(double("2"))
+    with pytest.raises(ReturnValueError):
+        asyncio.run(double(11))
+
+
+def test_original_coroutine_not_created_when_invalid():
+    created = []
+
+    @validate_inputs
+    async def func(x: int):
+        created.append(x)
+
+    with pytest.raises(ArgumentError):
+        asyncio.run(func("x"))
+    assert created == []
+
+
+def test_when_arguments_are_checked():
+    if hasattr(inspect, "markcoroutinefunction"):
+        # Python 3.12+: when the function is called.
+        with pytest.raises(ArgumentError):
+            double("2")
+    else:
+        # Otherwise, when the returned coroutine is awaited.
+        coroutine = double("2")
+        assert inspect.iscoroutine(coroutine)
+        with pytest.raises(ArgumentError):
+            asyncio.run(coroutine)
+
+
+def test_async_generator():
+    assert asyncio.run(collect(count_up(3))) == [0, 1, 2]
+    with pytest.raises(ArgumentError):
+        asyncio.run(collect(count_up("3")))
+    with pytest.raises(ReturnValueError):
+        asyncio.run(collect(count_up(4)))
+
+
+def test_async_generator_send_and_close():
+    async def run():
+        async_generator = echo(5)
+        items = [await async_generator.asend(None)]
+        items.append(await async_generator.asend("hi"))
+        await async_generator.aclose()
+        return items
+
+    assert asyncio.run(run()) == [0, "hi"]
+
+
+def test_disabled():
+    set_validation(False)
+    try:
+        assert asyncio.run(double(11)) == "too large"
+        assert asyncio.run(collect(count_up(4))) == [0, 1, 2, 3]
+    finally:
+        set_validation(True)
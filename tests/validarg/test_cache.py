@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Tuple
+
+import pytest
+
+from parachute import (
+    validate_inputs,
+    ArgumentError,
+    get_check_cache_info,
+    either,
+    vector,
+)
+
+
+@dataclass(frozen=True)
+class Config:
+    size: int
+    name: str
+
+
+class Color(Enum):
+    RED = 1
+
+
+@validate_inputs(cache_size=2)
+def my_function(
+    a: either("x", "y"), b: Tuple[bool, ...] = (), c: Config = Config(1, "c"), d=0
+):
+    return a
+
+
+def test_hits_and_misses():
+    my_function.check_plan.by_name["a"].check.cache_clear()
+    for _ in range(3):
+        my_function("x")
+    info = get_check_cache_info(my_function)["a"]
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+def test_bounded():
+    for a in ("x", "y", "x", "y"):
+        my_function(a, (True,))
+    assert get_check_cache_info(my_function)["a"].currsize == 2
+    for b in ((), (True,), (False,), (True, True)):
+        my_function("x", b)
+    assert get_check_cache_info(my_function)["b"].currsize == 2
+
+
+def test_element_types_are_part_of_key():
+    my_function("x", (True,))
+    with pytest.raises(ArgumentError):
+        my_function("x", (1,))
+
+
+def test_frozen_dataclass():
+    my_function("x", c=Config(2, "c"))
+    my_function("x", c=Config(2, "c"))
+    assert get_check_cache_info(my_function)["c"].hits >= 1
+
+
+def test_mutable_values_not_cached():
+    @validate_inputs(cache_size=10)
+    def func(a: list):
+        pass
+
+    func([1])
+    func([1])
+    assert get_check_cache_info(func)["a"].currsize == 0
+    with pytest.raises(ArgumentError):
+        func(Color.RED)
+    assert get_check_cache_info(func)["a"].currsize == 1
+
+
+def test_no_cache_by_default():
+    @validate_inputs
+    def func(a: int):
+        pass
+
+    assert get_check_cache_info(func) == {}
+
+
+def test_coerced_values_are_cached():
+    @validate_inputs(coerce=True, cache_size=4)
+    def func(a: either("x", "y"), b: Tuple[int, ...] = (), c: vector(int) = (0,)):
+        return c
+
+    for _ in range(3):
+        func("x", (1, 2))
+    info = get_check_cache_info(func)
+    assert (info["a"].hits, info["a"].misses) == (2, 1)
+    assert info["b"].hits == 2
+    with pytest.raises(ArgumentError):
+        func("z")
+    with pytest.raises(ArgumentError):
+        func("z")
+    # Canonical values that are mutable are not shared between calls.
+    c_1 = func("x", c=(1, 2))
+    c_2 = func("x", c=(1, 2))
+    assert list(c_1) == list(c_2) == [1, 2]
+    assert c_1 is not c_2
@@ -0,0 +1,48 @@
+import inspect
+from functools import partial
+
+from parachute import compile_check_plan, vector
+from parachute.validarg import _get_argspec
+
+
+def my_function(a: int, b, c: vector(length=2), d: str = "dd"):
+    pass
+
+
+plan = compile_check_plan(my_function)
+
+
+def test_only_annotated_parameters():
+    assert [p.name for p in plan.positional] == ["a", "c", "d"]
+    assert [p.index for p in plan.positional] == [0, 2, 3]
+    assert set(plan.by_name) == {"a", "c", "d"}
+
+
+def test_bound_checks():
+    check_a = plan.by_name["a"].check
+    assert check_a(3)
+    assert not check_a("3")
+    check_c = plan.by_name["c"].check
+    assert check_c([1, 2])
+    assert not check_c([1, 2, 3])
+
+
+def test_argspec_from_code():
+    def func(a, b: int = 1, /, c=2, *args: str, d, e=3, **kwargs: float):
+        x = 1
+        return x
+
+    class Class:
+        def method(self, a, *, b):
+            pass
+
+    for function in (
+        my_function,
+        func,
+        Class.method,
+        Class().method,
+        lambda *args: args,
+        partial(func, 1),
+        print,
+    ):
+        assert _get_argspec(function) == inspect.getfullargspec(function)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from parachute import validate_inputs, ArgumentError, CastingError, vector, shape
+
+
+@validate_inputs(coerce=True)
+def my_function(a: vector(float), b: int = 2, c: shape() = [3, 4], d=None):
+    return a, b, c, d
+
+
+def test_cast_values_are_passed():
+    a, b, c, d = my_function([1, 2, 3], 5, (i for i in range(2)), d=[1])
+    assert type(a) == np.ndarray
+    assert a.dtype == float
+    assert b == 5
+    assert c == (0, 1)
+    assert d == [1]
+
+
+def test_kwargs():
+    a, _, c, _ = my_function(a=(1, 2), c=np.array([5, 6]))
+    assert type(a) == np.ndarray
+    assert c == (5, 6)
+    assert type(c) == tuple
+
+
+def test_defaults():
+    _, b, c, _ = my_function([1])
+    assert b == 2
+    assert c == (3, 4)
+    _, _, c, _ = my_function([1], 2, [8])
+    assert c == (8,)
+
+
+def test_positional_only_defaults():
+    @validate_inputs(coerce=True)
+    def func(a, b: vector(float) = (1, 2), c=None, d: shape() = [3], /, e=5):
+        return a, b, c, d, e
+
+    a, b, c, d, e = func(0)
+    assert type(b) == np.ndarray
+    assert d == (3,)
+    assert (a, c, e) == (0, None, 5)
+    _, b, c, d, _ = func(0, [3], "c")
+    assert list(b) == [3]
+    assert c == "c"
+    assert d == (3,)
+    with pytest.raises(TypeError):
+        func()
+
+
+def test_no_copy_of_valid_array():
+    a = np.arange(3.0)
+    assert my_function(a)[0] is a
+
+
+def test_invalid():
+    with pytest.raises(ArgumentError):
+        my_function([1j])
+    with pytest.raises(ArgumentError):
+        my_function([1], b="2")
+    with pytest.raises(ArgumentError) as excinfo:
+        my_function([1], c=["a"])
+    assert type(excinfo.value.__cause__) == CastingError
+
+
+def test_without_coerce():
+    @validate_inputs()
+    def func(a: vector(float), b: int = 1):
+        return a
+
+    assert func([1, 2]) == [1, 2]
@@ -0,0 +1,70 @@
+import pytest
+
+from parachute import (
+    validate_inputs,
+    ArgumentError,
+    ArgumentErrors,
+    CastingError,
+    SpecificationError,
+    vector,
+    shape,
+)
+
+
+@validate_inputs(collect_errors=True)
+def my_function(a: int, b: str = "b", *more: float, c: shape() = (), **kw: bool):
+    return a
+
+
+def test_valid():
+    assert my_function(1, "b", 2.0, 3, c=[1, 2], d=True) == 1
+
+
+def test_all_errors_listed():
+    with pytest.raises(ArgumentErrors) as excinfo:
+        my_function("a", 2, 3.0, "x", c=["no"], d=True, e=None)
+    errors = excinfo.value.errors
+    assert [error.arg_name for error in errors] == ["a", "b", "more", "c", "kw"]
+    assert [error.value for error in errors] == ["a", 2, "x", ["no"], None]
+    assert type(errors[0].reason) == SpecificationError
+    assert type(errors[3].reason) == CastingError
+
+
+def test_single_error():
+    with pytest.raises(ArgumentError) as excinfo:
+        my_function(1, 2)
+    assert len(excinfo.value.errors) == 1
+
+
+def test_message():
+    with pytest.raises(ArgumentErrors) as excinfo:
+        my_function("a", c=["no"])
+    message = str(excinfo.value)
+    assert message.startswith(
+        "2 argument(s) of my_function did not match their parameter annotation: "
+        "`a`, `c`."
+    )
+    assert "Could not be cast to the canonical type: TypeError" in message
+    as_dict = excinfo.value.as_dict()
+    assert [error["parameter"] for error in as_dict["errors"]] == ["a", "c"]
+
+
+def test_coerce():
+    @validate_inputs(coerce=True, collect_errors=True)
+    def func(a: vector(float), b: vector(int)):
+        return a, b
+
+    func([1.0], [1])
+    with pytest.raises(ArgumentErrors) as excinfo:
+        func([1j], [1.5])
+    assert len(excinfo.value.errors) == 2
+
+
+def test_reason_without_collecting():
+    @validate_inputs
+    def func(a: vector(float)):
+        pass
+
+    with pytest.raises(ArgumentError) as excinfo:
+        func([1j])
+    assert type(excinfo.value.reason) == CastingError
@@ -0,0 +1,120 @@
+import io
+import json
+
+import pytest
+
+from parachute import (
+    validate_inputs,
+    ArgumentError,
+    either,
+    get_check_cache_info,
+    get_validation_stats,
+    dump_validation_stats,
+    reset_validation_stats,
+    set_instrumentation,
+)
+
+
+@validate_inputs(instrument=True)
+def my_function(a: int, b: either("x", "y") = "x"):
+    return a
+
+
+def get_stats(function):
+    return get_validation_stats()[f"{__name__}.{function.__qualname__}"]
+
+
+def test_counts():
+    reset_validation_stats()
+    my_function(1)
+    my_function(2, "y")
+    with pytest.raises(ArgumentError):
+        my_function("3")
+    stats = get_stats(my_function)
+    assert (stats.num_calls, stats.num_failures) == (3, 1)
+    a_stats = stats.parameters["a"].as_dict()
+    assert (a_stats["checks"], a_stats["failures"]) == (3, 1)
+    assert stats.parameters["b"].num_checks == 1
+    assert a_stats["total_time_ns"] >= a_stats["p99_ns"] >= a_stats["p50_ns"] > 0
+
+
+def test_default_checks_not_counted():
+    @validate_inputs(instrument=True)
+    def func(a: int = 1, b: either("x", "y") = "x"):
+        pass
+
+    stats = get_stats(func)
+    assert stats.num_calls == 0
+    assert all(p.num_checks == 0 for p in stats.parameters.values())
+    func()
+    assert all(p.num_checks == 0 for p in stats.parameters.values())
+    func(2)
+    assert stats.parameters["a"].num_checks == 1
+
+    @validate_inputs(coerce=True, instrument=True)
+    def coercing(a: float = 1.0):
+        pass
+
+    assert get_stats(coercing).parameters["a"].num_checks == 0
+
+
+def test_coerce_failures():
+    @validate_inputs(coerce=True, instrument=True)
+    def func(a: float):
+        pass
+
+    func(1)
+    with pytest.raises(ArgumentError):
+        func("x")
+    a_stats = get_stats(func).parameters["a"]
+    assert (a_stats.num_checks, a_stats.num_failures) == (2, 1)
+
+
+def test_nested_failures_not_counted():
+    @validate_inputs(instrument=True)
+    def outer(a: int):
+        my_function("not an int")
+
+    with pytest.raises(ArgumentError):
+        outer(1)
+    assert get_stats(outer).num_failures == 0
+
+
+def test_dump():
+    reset_validation_stats()
+    my_function(1)
+    file = io.StringIO()
+    text = dump_validation_stats(file)
+    assert file.getvalue() == text
+    dumped = json.loads(text)[f"{__name__}.my_function"]
+    assert dumped["calls"] == 1
+    assert dumped["parameters"]["a"]["checks"] == 1
+
+
+def test_global_setting():
+    @validate_inputs
+    def not_instrumented(a: int):
+        pass
+
+    set_instrumentation(True)
+    try:
+
+        @validate_inputs
+        def instrumented(a: int):
+            pass
+
+    finally:
+        set_instrumentation(False)
+    names = get_validation_stats().keys()
+    assert f"{__name__}.{instrumented.__qualname__}" in names
+    assert f"{__name__}.{not_instrumented.__qualname__}" not in names
+
+
+def test_cache_info_preserved():
+    @validate_inputs(instrument=True, cache_size=4)
+    def func(a: int):
+        pass
+
+    func(1)
+    func(1)
+    assert get_check_cache_info(func)["a"].hits == 1
@@ -0,0 +1,109 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+import parachute.validarg
+from parachute import (
+    validate_inputs,
+    ArgumentError,
+    preflight,
+    set_lazy_compilation,
+    get_check_cache_info,
+)
+
+
+def test_compiled_on_first_call():
+    with patch.object(
+        parachute.validarg,
+        "compile_check_plan",
+        wraps=parachute.validarg.compile_check_plan,
+    ) as compile_check_plan:
+
+        @validate_inputs(lazy=True)
+        def func(a: int):
+            return a
+
+        assert compile_check_plan.call_count == 0
+        assert not hasattr(func, "check_plan")
+        assert func(1) == 1
+        assert func(2) == 2
+        assert compile_check_plan.call_count == 1
+    with pytest.raises(ArgumentError):
+        func("1")
+
+
+def test_invalid_default_reported_on_first_call():
+    @validate_inputs(lazy=True)
+    def func(a: int = "not an int"):
+        pass
+
+    for _ in range(2):
+        with pytest.raises(ArgumentError):
+            func()
+
+
+def test_preflight():
+    @validate_inputs(lazy=True)
+    def valid(a: int = 1):
+        pass
+
+    @validate_inputs(lazy=True)
+    def invalid(a: int = "not an int"):
+        pass
+
+    assert preflight(valid) == 1
+    assert preflight(valid) == 0
+    with pytest.raises(ArgumentError):
+        preflight()
+    with pytest.raises(ArgumentError):
+        preflight(invalid)
+
+
+def test_global_setting():
+    set_lazy_compilation(True)
+    try:
+
+        @validate_inputs(cache_size=4)
+        def func(a: int):
+            pass
+
+    finally:
+        set_lazy_compilation(False)
+    assert not hasattr(func, "check_plan")
+    assert "a" in get_check_cache_info(func)
+
+
+def test_coroutine_function():
+    @validate_inputs(lazy=True, check_return=True)
+    async def func(a: int) -> int:
+        return a
+
+    assert inspect.iscoroutinefunction(func)
+    assert asyncio.run(func(3)) == 3
+    with pytest.raises(ArgumentError):
+        asyncio.run(func("3"))
+
+
+def test_compiled_once_by_concurrent_calls():
+    num_compilations = 0
+    compile_check_plan = parachute.validarg.compile_check_plan
+
+    def counting_compile_check_plan(*args, **kwargs):
+        nonlocal num_compilations
+        num_compilations += 1
+        return compile_check_plan(*args, **kwargs)
+
+    with patch.object(
+        parachute.validarg, "compile_check_plan", counting_compile_check_plan
+    ):
+
+        @validate_inputs(lazy=True)
+        def func(a: int):
+            return a
+
+        with ThreadPoolExecutor(8) as pool:
+            assert list(pool.map(func, range(100))) == list(range(100))
+    assert num_compilations == 1
@@ -0,0 +1,128 @@
+from typing import Iterator, Generator, Iterable
+
+import numpy as np
+import pytest
+
+from parachute import validate_inputs, ReturnValueError, ArgumentError, vector
+
+
+@validate_inputs(check_return=True)
+def plain(a: int, b=None) -> str:
+    return b
+
+
+@validate_inputs(check_return=True)
+def validated(length: int = 2) -> vector(float, length=2):
+    return np.ones(length)
+
+
+def test_plain():
+    assert plain(1, "b") == "b"
+    with pytest.raises(ReturnValueError):
+        plain(1, 2)
+
+
+def test_validated_argument_annotation():
+    assert validated().shape == (2,)
+    with pytest.raises(ReturnValueError):
+        validated(3)
+
+
+def test_none_annotation():
+    @validate_inputs(check_return=True)
+    def func(value=None) -> None:
+        return value
+
+    assert func() is None
+    with pytest.raises(ReturnValueError):
+        func(3)
+
+    @validate_inputs(check_return=True)
+    def not_annotated(value=None):
+        return value
+
+    assert not_annotated(3) == 3
+
+
+def test_not_checked_by_default():
+    @validate_inputs
+    def func(a: int = 1) -> str:
+        return a
+
+    assert func() == 1
+
+
+@validate_inputs(check_return=True)
+def generator(items: list = []) -> Generator[int, str, str]:
+    received = []
+    for item in items:
+        sent = yield item
+        received.append(sent)
+    return ",".join(str(x) for x in received)
+
+
+def test_generator_lazily_checked():
+    gen = generator([1, 2, "three", 4])
+    assert next(gen) == 1
+    assert next(gen) == 2
+    with pytest.raises(ReturnValueError):
+        next(gen)
+
+
+def test_generator_send_and_return_value():
+    gen = generator([1, 2])
+    assert next(gen) == 1
+    assert gen.send("a") == 2
+    with pytest.raises(StopIteration) as excinfo:
+        gen.send("b")
+    assert excinfo.value.value == "a,b"
+
+
+def test_generator_throw_and_close():
+    gen = generator([1, 2])
+    next(gen)
+    with pytest.raises(KeyError):
+        gen.throw(KeyError)
+    gen = generator([1, 2])
+    next(gen)
+    gen.close()
+
+
+@validate_inputs(check_return=True)
+def iterator(items: list = []) -> Iterator[int]:
+    return iter(items)
+
+
+def test_iterator():
+    assert list(iterator([1, 2])) == [1, 2]
+    it = iterator([1, None])
+    next(it)
+    with pytest.raises(ReturnValueError):
+        next(it)
+    with pytest.raises(ReturnValueError):
+
+        @validate_inputs(check_return=True)
+        def not_an_iterator(a: int = 0) -> Iterator[int]:
+            return [1]
+
+        not_an_iterator()
+
+
+@validate_inputs(check_return=True)
+def iterable(items: list = []) -> Iterable[int]:
+    return items
+
+
+def test_iterable_container_not_copied():
+    items = [1, 2]
+    assert iterable(items) is items
+    with pytest.raises(ReturnValueError):
+        iterable([1, "2"])
+
+
+def test_error_message():
+    with pytest.raises(ArgumentError) as excinfo:
+        plain(1, 2)
+    assert str(excinfo.value).startswith(
+        "Value returned by plain did not match its return annotation."
+    )
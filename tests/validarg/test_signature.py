@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from parachute import validate_inputs, ArgumentError, vector
+
+
+def test_no_defaults():
+    @validate_inputs
+    def func(a: int, b: str):
+        return a
+
+    assert func(1, "b") == 1
+    with pytest.raises(ArgumentError):
+        func(1, 2)
+
+
+@validate_inputs
+def keyword_only(a: int, *, b: str, c: float = 1.0, d=None):
+    return b
+
+
+def test_keyword_only():
+    assert keyword_only(1, b="b") == "b"
+    keyword_only(1, b="b", c=2, d="anything")
+    with pytest.raises(ArgumentError):
+        keyword_only(1, b=2)
+    with pytest.raises(ArgumentError):
+        keyword_only(1, b="b", c="c")
+
+
+def test_keyword_only_default():
+    with pytest.raises(ArgumentError):
+
+        @validate_inputs
+        def func(*, a: int = "jojo"):
+            pass
+
+
+@validate_inputs
+def varargs(a: str, *arrays: vector(float, length=2), **options: bool):
+    return len(arrays), options
+
+
+def test_varargs():
+    assert varargs("a") == (0, {})
+    assert varargs("a", [1, 2], np.ones(2)) == (2, {})
+    with pytest.raises(ArgumentError):
+        varargs("a", [1, 2], [1, 2, 3])
+    with pytest.raises(ArgumentError):
+        varargs(1, [1, 2])
+
+
+def test_varkw():
+    assert varargs("a", verbose=True) == (0, {"verbose": True})
+    assert varargs(a="a", verbose=True) == (0, {"verbose": True})
+    with pytest.raises(ArgumentError) as excinfo:
+        varargs("a", verbose="yes")
+    assert excinfo.value.arg_name == "options"
+    with pytest.raises(ArgumentError) as excinfo:
+        varargs(a=1, verbose=True)
+    assert excinfo.value.arg_name == "a"
+
+
+def test_unannotated_named_parameter_is_not_varkw():
+    @validate_inputs
+    def func(a, **kwargs: int):
+        return a
+
+    assert func(a="not an int", b=1) == "not an int"
+    with pytest.raises(ArgumentError):
+        func(a="x", b="not an int")
+
+
+def test_coerce_varargs_and_kwargs():
+    @validate_inputs(coerce=True)
+    def func(*arrays: vector(float), c: vector(float) = [1], **more: vector(int)):
+        return arrays, c, more
+
+    arrays, c, more = func([1, 2], [3], x=[4])
+    assert all(type(a) == np.ndarray for a in arrays)
+    assert type(c) == np.ndarray
+    assert type(more["x"]) == np.ndarray
+    with pytest.raises(ArgumentError):
+        func([1], x=[1.5])
+
+
+@validate_inputs
+def positional_only(a: int, /, **options: str):
+    return a, options
+
+
+def test_positional_only_name_as_keyword():
+    assert positional_only(1, a="x") == (1, {"a": "x"})
+    with pytest.raises(ArgumentError):
+        positional_only(1, a=2)
+    with pytest.raises(ArgumentError):
+        positional_only("1")
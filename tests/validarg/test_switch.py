@@ -0,0 +1,81 @@
+import pytest
+
+from parachute import (
+    validate_inputs,
+    ArgumentError,
+    set_validation,
+    validation_mode,
+)
+from parachute.validarg import _apply_environment_setting
+
+
+@validate_inputs
+def my_function(a: int, b: str = "b"):
+    return a
+
+
+def test_disabled():
+    with validation_mode(enabled=False):
+        assert my_function("not an int") == "not an int"
+    with pytest.raises(ArgumentError):
+        my_function("not an int")
+
+
+def test_set_validation():
+    try:
+        set_validation(False)
+        my_function("not an int")
+    finally:
+        set_validation(True)
+    with pytest.raises(ArgumentError):
+        my_function("not an int")
+
+
+def test_sampled():
+    @validate_inputs
+    def func(a: int, b: int = 0):
+        pass
+
+    with validation_mode(every=3):
+        num_errors = 0
+        for _ in range(9):
+            try:
+                func("not an int")
+            except ArgumentError:
+                num_errors += 1
+    assert num_errors == 3
+
+
+def test_strip():
+    def func(a: int, b: int = 0):
+        pass
+
+    with validation_mode(enabled=False, strip=True):
+        assert validate_inputs(func) is func
+    assert validate_inputs(func) is not func
+
+
+def test_coerce_unaffected():
+    @validate_inputs(coerce=True)
+    def func(a: int, b: int = 0):
+        pass
+
+    with validation_mode(enabled=False):
+        with pytest.raises(ArgumentError):
+            func("not an int")
+
+
+def test_environment_variable():
+    with validation_mode():
+        _apply_environment_setting("off")
+        my_function("not an int")
+        _apply_environment_setting("on")
+        with pytest.raises(ArgumentError):
+            my_function("not an int")
+        with pytest.raises(ValueError):
+            _apply_environment_setting("sometimes")
+
+
+def test_invalid_every():
+    with pytest.raises(ValueError):
+        set_validation(every=0)
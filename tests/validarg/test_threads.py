@@ -0,0 +1,104 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+from parachute import (
+    validate_inputs,
+    ArgumentError,
+    either,
+    vector,
+    shape,
+    array,
+    get_validation_stats,
+    clear_validator_cache,
+)
+
+num_threads = 16
+num_calls = 500
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    # Make races more likely.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_concurrently(task):
+    barrier = Barrier(num_threads)
+
+    def start(thread_index):
+        barrier.wait()
+        return task(thread_index)
+
+    with ThreadPoolExecutor(num_threads) as pool:
+        return list(pool.map(start, range(num_threads)))
+
+
+@validate_inputs(cache_size=8, instrument=True)
+def func(
+    a: either("x", "y", int),
+    b: vector(float, 3) = (0, 0, 0),
+    c: shape((2, None)) = (2, 1),
+    d: Tuple[int, ...] = (),
+):
+    return a
+
+
+@validate_inputs(coerce=True)
+def coercing_func(a: vector(float), b: array(int, ndim=2) = ((1,),)):
+    return a, b
+
+
+def test_calls():
+    def task(thread_index):
+        for i in range(num_calls):
+            assert func(i % 5, [i, 0.5, 1], (2, thread_index), (i,)) == i % 5
+            with pytest.raises(ArgumentError):
+                func("z")
+            with pytest.raises(ArgumentError):
+                func("x", b=[1, 2])
+            a, b = coercing_func([thread_index, i])
+            assert a.dtype == float and a[1] == i and b.shape == (1, 1)
+        return True
+
+    assert all(run_concurrently(task))
+
+
+def test_instrumentation_counts():
+    stats = get_validation_stats()[f"{__name__}.func"]
+    stats.reset()
+
+    def task(thread_index):
+        for i in range(num_calls):
+            func("x", d=(i, thread_index))
+
+    run_concurrently(task)
+    assert stats.num_calls == num_threads * num_calls
+    assert stats.parameters["d"].num_checks == num_threads * num_calls
+
+
+def test_interned_classes():
+    def task(thread_index):
+        return [vector(float, length) for length in range(50)]
+
+    for _ in range(5):
+        clear_validator_cache()
+        results = run_concurrently(task)
+        for classes in results[1:]:
+            assert all(c1 is c2 for (c1, c2) in zip(classes, results[0]))
+
+
+def test_validators_are_immutable():
+    Vector = vector(float, 3)
+    with pytest.raises(AttributeError):
+        Vector.dtype_ = int
+    with pytest.raises(AttributeError):
+        del Vector.shape_spec_
+    assert Vector.check(np.ones(3))
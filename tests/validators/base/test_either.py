@@ -51,3 +51,18 @@ def test_validated_types():
     assert not Choice([1, 2, 3]).is_valid()
     assert not Choice([1]).is_valid()
     assert not Choice([[1, 2]]).is_valid()
+
+
+def test_partitioned_options():
+    Choice = either("a", "b", None, float, Union[bool, str], {"c": 1})
+    assert Choice.literal_options_ == {"a", "b", None}
+    assert Choice.type_options_ == (float, int)
+    assert len(Choice.option_checks_) == 2
+    assert Choice.check("a")
+    assert Choice.check(None)
+    assert Choice.check(3)
+    assert Choice.check("anything")
+    assert Choice.check({"c": 1})
+    assert not Choice.check({"c": 2})
+    assert not Choice.check([1])
+    assert not Choice.check(np.array([1, 2]))
@@ -0,0 +1,48 @@
+from parachute import (
+    either,
+    dimsize,
+    shape,
+    array,
+    vector,
+    get_validator_cache_info,
+    clear_validator_cache,
+)
+
+
+def test_same_spec_same_class():
+    assert either("a", "b") is either("a", "b")
+    assert dimsize(4) is dimsize(4)
+    assert shape((5, None)) is shape((5, None))
+    assert vector(float, 2) is vector(float, 2)
+
+
+def test_normalised_spec():
+    assert shape([5, 4]) is shape((5, 4))
+    assert array(float, ndim=1) is vector(float)
+    assert array(int, shape_spec=[2]) is vector(int, length=2)
+
+
+def test_different_spec_different_class():
+    assert either("a", "b") is not either("a", "c")
+    assert either(1) is not either(True)
+    # Also when the types of nested values differ.
+    assert either((1, True)) is not either((1, 1))
+    assert either((1, True)).get_annotation_str() == "One of {(1, True)}"
+    assert shape((2, 2.0)) is not shape((2, 2))
+    assert shape((2, 2)).get_annotation_str() == "Array shape (2, 2)."
+    assert vector(float, 2) is not vector(int, 2)
+
+
+def test_unhashable_spec():
+    Choice = either({"a": 1}, "b")
+    assert Choice({"a": 1}).is_valid()
+    assert Choice is not either({"a": 1}, "b")
+
+
+def test_cache_info_and_clear():
+    V = vector(complex, 3)
+    info = get_validator_cache_info()
+    assert info["_make_array_class"].currsize >= 1
+    clear_validator_cache()
+    assert get_validator_cache_info()["_make_array_class"].currsize == 0
+    assert vector(complex, 3) is not V
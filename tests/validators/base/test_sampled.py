@@ -0,0 +1,56 @@
+from typing import List, Tuple, Dict, Set, Sequence
+
+import pytest
+
+from parachute import sampled, vector, validate_inputs, ArgumentError
+
+
+def test_full():
+    Sampled = sampled(List[int])
+    assert Sampled.check([1, 2, 3])
+    assert not Sampled.check([1, 2, "3"])
+    assert not Sampled.check((1, 2, 3))
+    assert Sampled([1]).is_valid()
+
+
+def test_first():
+    Sampled = sampled(Tuple[int, ...], first=2)
+    assert Sampled.check((1, 2, "not checked"))
+    assert not Sampled.check((1, "2"))
+    assert not Sampled.check([1, 2])
+
+
+def test_random():
+    Sampled = sampled(Sequence[float], random=5)
+    assert Sampled.check(list(range(100)))
+    assert not Sampled.check(["a"] * 100)
+    assert sampled(List[int], random=5).check([1, 2])
+    # Not indexable: the first elements are checked.
+    assert sampled(Set[int], random=5).check(set(range(100)))
+
+
+def test_mapping_and_validators():
+    assert sampled(Dict[str, int], first=1).check({"a": 1, "b": "x"})
+    assert not sampled(Dict[str, int]).check({"a": 1, "b": "x"})
+    Vectors = sampled(List[vector(float, 2)], random=2)
+    assert Vectors.check([[1, 2], (3, 4.5)])
+    assert not Vectors.check([[1, 2], [3]])
+
+
+def test_invalid_specs():
+    with pytest.raises(TypeError):
+        sampled(int)
+    with pytest.raises(TypeError):
+        sampled(Tuple[int, str])
+    with pytest.raises(ValueError):
+        sampled(List[int], first=1, random=1)
+
+
+def test_as_annotation():
+    @validate_inputs
+    def func(items: sampled(List[int], first=10)):
+        return len(items)
+
+    assert func(list(range(10 ** 6))) == 10 ** 6
+    with pytest.raises(ArgumentError, match="first 10 elements"):
+        func(["a"])
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from parachute import array, vector, validate_inputs, ArgumentError
+
+
+def test_numpy_dtype():
+    Vector = vector(np.float32)
+    assert Vector.check(np.ones(3, dtype=np.float16))
+    assert not Vector.check(np.ones(3))
+    assert Vector(np.ones(3, dtype=np.int8)).dtype == np.float32
+    assert vector("float32") is Vector
+
+
+def test_exact_dtype():
+    Vector = vector(np.float32, exact_dtype=True)
+    a = np.ones(3, dtype=np.float32)
+    assert Vector.check(a)
+    assert np.shares_memory(Vector(a), a)
+    assert not Vector.check(np.ones(3, dtype=np.float16))
+    assert not Vector(np.ones(3, dtype=np.float16)).is_valid()
+    assert not Vector.check([1.0, 2.0])
+
+
+def test_structured_dtype():
+    dtype = np.dtype([("x", np.float64), ("n", np.int32)])
+    Array = array(dtype, ndim=1, exact_dtype=True)
+    assert Array.check(np.zeros(4, dtype=dtype))
+    assert not Array.check(np.zeros(4))
+
+
+def test_byteorder():
+    big_endian = np.ones(3, dtype=">f8")
+    little_endian = np.ones(3, dtype="<f8")
+    assert vector(float, byteorder=">").check(big_endian)
+    assert not vector(float, byteorder=">").check(little_endian)
+    assert vector(float, byteorder="<").check(little_endian)
+    native = big_endian if big_endian.dtype.isnative else little_endian
+    assert vector(float, byteorder="=").check(native)
+    assert vector(float, byteorder="=") is vector(float, byteorder=native.dtype.str[0])
+    with pytest.raises(ValueError):
+        vector(byteorder="big")
+
+
+def test_contiguous():
+    a = np.ones((4, 6))
+    assert array(contiguous="C").check(a)
+    assert not array(contiguous="F").check(a)
+    assert array(contiguous="F").check(a.T)
+    assert array(contiguous="any").check(a.T)
+    assert not array(contiguous="any").check(a[:, ::2])
+    assert not array(contiguous="C")(a[:, ::2]).is_valid()
+    with pytest.raises(ValueError):
+        array(contiguous="K")
+
+
+def test_aligned_and_writeable():
+    a = np.ones(4)
+    assert vector(aligned=True, writeable=True).check(a)
+    a.flags.writeable = False
+    assert not vector(writeable=True).check(a)
+    assert vector(writeable=False).check(a)
+    unaligned = np.frombuffer(bytes(33), dtype=np.float64, count=4, offset=1)
+    assert not unaligned.flags.aligned
+    assert not vector(aligned=True).check(unaligned)
+
+
+def test_lists_are_cast_to_conforming_arrays():
+    Vector = vector(float, contiguous="C", aligned=True, writeable=True)
+    assert Vector.check([1.0, 2.0])
+    assert Vector([1.0, 2.0]).is_valid()
+
+
+def test_annotation_str():
+    text = vector(np.float32, exact_dtype=True, contiguous="C").get_annotation_str()
+    assert "float32" in text
+    assert "exact dtype" in text and "contiguous `C`" in text
+    assert "not writeable" in vector(writeable=False).get_annotation_str()
+
+
+def test_coerce_passes_array_through():
+    @validate_inputs(coerce=True)
+    def kernel(a: array(np.float32, ndim=2, exact_dtype=True, contiguous="C")):
+        return a
+
+    a = np.ones((3, 3), dtype=np.float32)
+    assert kernel(a) is a
+    with pytest.raises(ArgumentError):
+        kernel(np.asfortranarray(a))
+    with pytest.raises(ArgumentError):
+        kernel(a.astype(np.float64))
@@ -1,6 +1,6 @@
 import numpy as np
 
-from parachute import shape
+from parachute import shape, compile_shape_spec
 
 
 def test_shapespec_any():
@@ -68,3 +68,16 @@ def test_repr():
     }
     for spec, string in pairs.items():
         assert shape(spec).get_annotation_str() == string
+
+
+def test_compiled_spec():
+    assert compile_shape_spec(None)((1, 2, 3))
+    matches = compile_shape_spec((5, 4))
+    assert matches((5, 4))
+    assert not matches((5, 4, 1))
+    assert not matches((4, 5))
+    matches = compile_shape_spec((5, None, 2))
+    assert matches((5, 0, 2))
+    assert matches(np.empty((5, 3, 2)).shape)
+    assert not matches((5, 3))
+    assert not matches((4, 3, 2))
@@ -0,0 +1,133 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from parachute import array, vector, validate_inputs, ArgumentError
+from parachute.validators.ndarray import ElementValueError
+
+
+def test_finite():
+    Vector = vector(finite=True)
+    assert Vector.check([1.0, 2.0])
+    assert not Vector.check([1.0, np.nan])
+    assert not Vector.check([np.inf])
+    assert not Vector([1.0, np.nan]).is_valid()
+    with pytest.raises(ElementValueError) as error_info:
+        Vector.coerce([0, 1, -np.inf])
+    assert error_info.value.index == (2,)
+
+
+def test_bounds():
+    Array = array(ndim=2, min_value=-1, max_value=1)
+    assert Array.check(np.zeros((3, 3)))
+    a = np.zeros((3, 3))
+    a[2, 1] = 1.5
+    a[2, 2] = -2
+    with pytest.raises(ElementValueError) as error_info:
+        Array.coerce(a)
+    assert error_info.value.index == (2, 1)
+    assert "larger than 1" in str(error_info.value)
+    assert vector(nonnegative=True).check([0, 1])
+    assert not vector(nonnegative=True).check([0, -1])
+    assert not vector(nonnegative=True, min_value=-5).check([-1])
+
+
+def test_monotonic():
+    assert vector(monotonic="increasing").check([1, 1, 2])
+    assert not vector(monotonic="strictly increasing").check([1, 1, 2])
+    assert vector(monotonic="strictly decreasing").check([3, 2, 1])
+    with pytest.raises(ElementValueError) as error_info:
+        vector(monotonic="increasing").coerce([0, 1, 2, 1])
+    assert error_info.value.index == (3,)
+    with pytest.raises(ValueError):
+        vector(monotonic="sorted")
+
+
+def test_scalars_and_empty_arrays():
+    assert array(finite=True).check(1.0)
+    with pytest.raises(ElementValueError) as error_info:
+        array(finite=True).coerce(np.nan)
+    assert error_info.value.index == ()
+    assert vector(finite=True, monotonic="increasing").check([])
+
+
+@pytest.mark.parametrize("parallel", [False, 4])
+def test_first_violation_across_chunks(parallel):
+    Vector = vector(finite=True, min_value=0, parallel=parallel)
+    a = np.arange(10 ** 6, dtype=float)
+    assert Vector.check(a)
+    a[700_001] = -1
+    a[900_000] = np.nan
+    with pytest.raises(ElementValueError) as error_info:
+        Vector.coerce(a)
+    assert error_info.value.index == (700_001,)
+    a = np.arange(10 ** 6, dtype=float).reshape(1000, 1000)
+    a[600, 7] = a[800, 0] = np.nan
+    with pytest.raises(ElementValueError) as error_info:
+        array(ndim=2, finite=True, parallel=parallel).coerce(a)
+    assert error_info.value.index == (600, 7)
+
+
+@pytest.mark.parametrize("parallel", [False, 4])
+def test_wide_arrays_are_checked_in_small_chunks(parallel):
+    Array = array(ndim=2, finite=True, max_value=10, parallel=parallel)
+    a = np.zeros((1, 2 * 10 ** 6))
+    a[0, 1_500_000] = np.nan
+    tracemalloc.start()
+    try:
+        with pytest.raises(ElementValueError) as error_info:
+            Array.coerce(a)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert error_info.value.index == (0, 1_500_000)
+    assert peak_memory < a.nbytes / 16
+
+
+@pytest.mark.parametrize("parallel", [False, 4])
+def test_first_violation_in_other_layouts(parallel):
+    Array = array(ndim=2, min_value=0, parallel=parallel)
+    a = np.zeros((300, 1000))
+    a[200, 3] = a[100, 900] = -1
+    for b in (a, np.asfortranarray(a), a[:, ::-1], np.zeros((600, 2000))[::2, ::2]):
+        assert Array.check(np.abs(b))
+    with pytest.raises(ElementValueError) as error_info:
+        Array.coerce(a[:, ::-1])
+    assert error_info.value.index == (100, 99)
+    with pytest.raises(ElementValueError) as error_info:
+        # (Fortran-ordered arrays are checked in memory order).
+        Array.coerce(np.asfortranarray(a))
+    assert error_info.value.index == (200, 3)
+
+
+def test_monotonic_across_chunks():
+    a = np.arange(10 ** 6)
+    a[500_000] = 0
+    with pytest.raises(ElementValueError) as error_info:
+        vector(int, monotonic="increasing", parallel=3).coerce(a)
+    assert error_info.value.index == (500_000,)
+
+
+def test_error_message():
+    @validate_inputs
+    def func(probabilities: vector(min_value=0, max_value=1)):
+        pass
+
+    func([0.5, 1])
+    with pytest.raises(ArgumentError, match=r"index \(1,\) is larger than 1"):
+        func([0.5, 2])
+
+
+def test_parallel_requires_value_constraints():
+    with pytest.raises(ValueError, match="parallel"):
+        array(parallel=4)
+    with pytest.raises(ValueError, match="parallel"):
+        vector(float, 3, parallel=True)
+    assert array(parallel=False) is array()
+    assert "values" not in vector(float).get_annotation_str()
+
+
+def test_annotation_str():
+    text = vector(finite=True, nonnegative=True).get_annotation_str()
+    assert "`(arbitrary,)`; values: finite, >= 0." in text
@@ -0,0 +1,79 @@
+import numpy as np
+
+from parachute import array, vector, set_zero_copy_default, validate_inputs
+
+
+def test_no_copy_for_same_dtype():
+    a = np.arange(6.0)
+    validated = vector(float)(a)
+    assert validated.is_valid()
+    assert np.shares_memory(validated, a)
+
+
+def test_non_contiguous():
+    a = np.arange(12.0).reshape(3, 4)[:, ::2]
+    validated = array(float, ndim=2)(a)
+    assert validated.is_valid()
+    assert np.shares_memory(validated, a)
+
+
+def test_cast_copies_when_dtype_changes():
+    a = np.arange(6)
+    validated = vector(float)(a)
+    assert validated.is_valid()
+    assert validated.dtype == float
+    assert not np.shares_memory(validated, a)
+
+
+def test_zero_copy_passes_compatible_dtype_through():
+    a = np.arange(6, dtype=np.int32)
+    validated = vector(float, zero_copy=True)(a)
+    assert validated.is_valid()
+    assert validated.dtype == np.int32
+    assert np.shares_memory(validated, a)
+    assert not vector(int, zero_copy=True)(np.arange(6.0)).is_valid()
+    assert not vector(float, 2, zero_copy=True)(a).is_valid()
+
+
+def test_global_default():
+    a = np.arange(6)
+    Vector = vector(float)
+    try:
+        set_zero_copy_default(True)
+        assert np.shares_memory(Vector(a), a)
+        assert not np.shares_memory(vector(float, zero_copy=False)(a), a)
+    finally:
+        set_zero_copy_default(False)
+    assert not np.shares_memory(Vector(a), a)
+
+
+def test_memory_mapped_arrays_are_not_copied(tmp_path):
+    mapped = np.memmap(tmp_path / "data.bin", dtype=float, mode="w+", shape=(100,))
+    Vector = vector(float, 100)
+    assert Vector.check(mapped)
+    validated = Vector(mapped)
+    assert validated.is_valid()
+    assert np.shares_memory(validated, mapped)
+
+
+def test_memory_mapped_arrays_are_cast_when_dtype_changes(tmp_path):
+    mapped = np.memmap(tmp_path / "data.bin", dtype=np.int32, mode="w+", shape=(100,))
+    mapped[:] = np.arange(100)
+
+    @validate_inputs(coerce=True)
+    def func(x: vector(float)):
+        return x
+
+    x = func(mapped)
+    assert x.dtype == float
+    assert list(x[:3]) == [0.0, 1.0, 2.0]
+    assert not np.shares_memory(x, mapped)
+
+
+def test_buffer_protocol_inputs_are_not_copied():
+    import mmap
+
+    buffer = mmap.mmap(-1, 64)
+    validated = vector(np.uint8, 64)(buffer)
+    assert validated.is_valid()
+    assert np.shares_memory(validated, np.frombuffer(buffer, dtype=np.uint8))
@@ -0,0 +1,63 @@
+from typing import Union
+
+import numpy as np
+
+from parachute import either, dimsize, shape, array, vector
+
+
+values = (
+    None,
+    True,
+    4,
+    4.0,
+    4.2,
+    1j,
+    "a",
+    "not a shape",
+    (),
+    (4,),
+    (5, 4),
+    (4, "4"),
+    [1, 2],
+    [1.5, 2],
+    [[1, 2]],
+    (i for i in range(2)),
+    np.array([1, 3]),
+    np.array([1.0, 2.0]),
+    np.array([1, 4 - 0.1j]),
+    np.ones((5, 4)),
+)
+
+validators = (
+    either("a", bool),
+    either("a", Union[bool, str]),
+    either("a", vector(int, length=2)),
+    dimsize(),
+    dimsize(4),
+    shape(),
+    shape((5, None)),
+    array(),
+    array(int, ndim=1),
+    array(complex, shape_spec=(5, 4)),
+    vector(float, length=2),
+    vector(np.int64, exact_dtype=True),
+    array(float, contiguous="F", writeable=True),
+)
+
+
+def test_check_agrees_with_instantiation():
+    for Validator in validators:
+        for value in values:
+            if hasattr(value, "__next__"):
+                # Don't consume generators twice.
+                continue
+            assert Validator.check(value) == Validator(value).is_valid(), (
+                Validator.get_annotation_str(),
+                value,
+            )
+
+
+def test_array_check_dtype():
+    Vector = vector(float)
+    assert Vector.check(np.arange(3))
+    assert not Vector.check(np.arange(3) * 1j)
@@ -0,0 +1,48 @@
+from typing import Union
+
+import numpy as np
+
+from parachute import either, dimsize, shape, vector, validate_many
+
+
+def agrees_with_check(Validator, arguments):
+    mask = Validator.check_many(arguments)
+    assert list(mask) == [Validator.check(arg) for arg in arguments]
+
+
+def test_dimsize():
+    for Validator in (dimsize(), dimsize(4)):
+        agrees_with_check(Validator, [4, 4.0, 4.2, True, -3, 42098507180])
+        agrees_with_check(Validator, np.array([4.0, 4.5, np.nan, np.inf, 5]))
+        agrees_with_check(Validator, np.arange(10))
+        agrees_with_check(Validator, ["4", None, 4, 1j])
+
+
+def test_dimsize_vectorised():
+    assert isinstance(dimsize(4).check_many(np.arange(10)), np.ndarray)
+
+
+def test_shape():
+    for Validator in (shape(), shape((5, None)), shape((5, 4)), shape((1,))):
+        agrees_with_check(Validator, [(5, 4), (5, 0), (4, 4), (5, False)])
+        agrees_with_check(Validator, np.array([[5, 4], [5, 0], [1, 1]]))
+        agrees_with_check(Validator, [(5, 4), (5,), (), (5, "4"), "no"])
+
+
+def test_shape_vectorised():
+    shapes = np.array([[5, 4], [5, 0], [1, 1]])
+    assert isinstance(shape((5, None)).check_many(shapes), np.ndarray)
+
+
+def test_either():
+    values = ["a", "b", "c", 4, True, [1, 2], {"a": 1}, None]
+    agrees_with_check(either("a", "b"), values)
+    agrees_with_check(either("a", Union[bool, str]), values)
+    agrees_with_check(either({"a": 1}, 4), values)
+    agrees_with_check(either("c", vector(int, length=2)), values)
+
+
+def test_validate_many():
+    assert validate_many(dimsize(4), np.array([4, 5, 4, 3])) == [1, 3]
+    assert validate_many(either("a", "b"), ["a", "c", "b", "d"]) == [1, 3]
+    assert validate_many(shape((2,)), [(2,), (3,)]) == [1]